@@ -0,0 +1 @@
+"""Offline benchmarks of the AGSI/ALSI clients"""
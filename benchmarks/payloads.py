@@ -0,0 +1,88 @@
+"""Deterministic AGSI/ALSI payloads in the shape of recorded API
+responses"""
+
+import datetime
+import random
+from typing import Any, Dict, List
+
+_AGSI_RECORD = {
+    "name": "Germany",
+    "code": "DE",
+    "url": "DE",
+    "gasDayStart": "2022-01-01",
+    "gasInStorage": "152.5467",
+    "consumption": "-",
+    "consumptionFull": "-",
+    "injection": "12.34",
+    "withdrawal": "1264.81",
+    "netWithdrawal": "1252.47",
+    "workingGasVolume": "243.2893",
+    "injectionCapacity": "3003.75",
+    "withdrawalCapacity": "7026.27",
+    "status": "E",
+    "trend": "-0.51",
+    "full": "62.70",
+    "info": [],
+}
+
+_ALSI_RECORD = {
+    "name": "Belgium",
+    "code": "BE",
+    "url": "BE",
+    "gasDayStart": "2022-01-01",
+    "inventory": {"lng": "240.7", "gwh": "1652.3"},
+    "sendOut": "86.5",
+    "dtmi": {"lng": "380", "gwh": "2608.4"},
+    "dtrs": "396.1",
+    "status": "C",
+    "info": [],
+}
+
+
+def storage_records(
+    count: int, alsi: bool = False, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Returns `count` storage records, newest gas day first.
+
+    Parameters
+    ----------
+    count : int
+        Number of records
+    alsi : bool, optional
+        Return ALSI instead of AGSI records, by default False
+    seed : int, optional
+        Seed of the values, by default 0
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        The records, equal for equal arguments
+    """
+    rng = random.Random(seed)
+    template = _ALSI_RECORD if alsi else _AGSI_RECORD
+    first_day = datetime.date(2022, 1, 1)
+    records = []
+    for offset in range(count):
+        gas_day = first_day - datetime.timedelta(days=offset)
+        record = dict(template, gasDayStart=gas_day.isoformat())
+        if alsi:
+            record["sendOut"] = "%.1f" % rng.uniform(0, 500)
+        else:
+            record["gasInStorage"] = "%.4f" % rng.uniform(0, 250)
+            record["full"] = "%.2f" % rng.uniform(0, 100)
+            record["trend"] = "%.2f" % rng.uniform(-1, 1)
+        records.append(record)
+    return records
+
+
+def pages(records: List[Dict[str, Any]], size: int) -> List[Dict[str, Any]]:
+    """Splits records into API result pages of `size` records."""
+    last_page = max(1, -(-len(records) // size))
+    return [
+        {
+            "last_page": last_page,
+            "total": len(records),
+            "data": records[(page - 1) * size : page * size],
+        }
+        for page in range(1, last_page + 1)
+    ]
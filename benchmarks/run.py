@@ -0,0 +1,243 @@
+"""Runs the offline benchmarks and compares them with the baselines.
+
+Usage::
+
+    python -m benchmarks.run                    # fail on regressions
+    python -m benchmarks.run --update-baselines # store the new results
+
+Every benchmark reports the best of several runs. The timings are
+divided by the best time of a fixed calibration workload run in the same
+process, so that they compare across machines, and a result which is
+more than `--tolerance` times its baseline fails the run, as does a
+fetch which does not return every row.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from roiti.gie.gie_pandas_client import GiePandasClient
+from roiti.gie.lookup_functions import (
+    lookup_country_agsi,
+    lookup_facility_agsi,
+)
+from roiti.gie.mappings.agsi_facility import AGSIFacility
+
+from .payloads import pages, storage_records
+from .server import start_server
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+ROWS = 10000
+PAGE_SIZE = 500
+REPEATS = 5
+
+# The unit of the timings divided by the calibration time
+CALIBRATED = "x cal"
+
+Results = Dict[str, Tuple[float, str]]
+
+
+def _best_of(function: Callable[[], Any], repeats: int = REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def _best_of_async(
+    function: Callable[[], Awaitable[Any]], repeats: int = REPEATS
+) -> float:
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        await function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def calibrate() -> float:
+    """Returns the best time of a fixed pure Python workload close to
+    the benchmarked one, JSON round trips and dict handling, which
+    scales with the speed of the machine and the interpreter."""
+    payload = json.dumps(storage_records(1000))
+
+    def workload() -> None:
+        records = json.loads(payload)
+        columns: Dict[str, List[Any]] = {}
+        for record in records:
+            for key, value in record.items():
+                columns.setdefault(key, []).append(value)
+        sorted(records, key=lambda record: record["gasDayStart"])
+
+    return _best_of(workload, repeats=2 * REPEATS)
+
+
+async def run_benchmarks() -> Results:
+    """Runs every benchmark against a local stand-in server.
+
+    Returns
+    -------
+    Results
+        The value and the unit of every benchmark, lower is better
+
+    Raises
+    ------
+    RuntimeError
+        If the paginated fetch does not return every row
+    """
+    calibration = calibrate()
+    records = storage_records(ROWS)
+    body = json.dumps({"total": ROWS, "data": records}).encode("utf-8")
+    runner, root_url = await start_server({"/api/": pages(records, PAGE_SIZE)})
+    client = GiePandasClient(api_key="benchmark")
+    url = root_url + "/api/"
+    results: Results = {}
+    try:
+        result = await client.fetch(url, all_pages=True)
+        if len(result["data"]) != ROWS:
+            raise RuntimeError(
+                "The fetch returned %s rows instead of %s!"
+                % (len(result["data"]), ROWS)
+            )
+
+        results["fetch_all_pages_10k_rows"] = (
+            await _best_of_async(lambda: client.fetch(url, all_pages=True)),
+            "s",
+        )
+
+        results["json_decode_10k_rows"] = (
+            _best_of(lambda: client.json_loads(body)),
+            "s",
+        )
+
+        result = client.json_loads(body)
+        results["pandas_df_format_10k_rows"] = (
+            _best_of(
+                lambda: client._pandas_df_format(result, client._FLOATING_COLS)
+            ),
+            "s",
+        )
+
+        keys: List[Any] = [
+            key
+            for facility in AGSIFacility
+            for key in (facility, facility.name, facility.code.lower())
+        ]
+        elapsed = _best_of(
+            lambda: [lookup_facility_agsi(key) for key in keys]
+            + [lookup_country_agsi("de") for _ in keys]
+        )
+        results["lookup_10k_keys"] = (elapsed / (2 * len(keys)) * 1e4, "s")
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = await client.fetch(url, all_pages=True)
+            client._pandas_df_format(result, client._FLOATING_COLS)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        results["peak_memory_10k_rows"] = (peak / 2**20, "MiB")
+    finally:
+        await client.close_session()
+        await runner.cleanup()
+
+    # Taken again after the benchmarks, the lower of both is the least noisy
+    calibration = min(calibration, calibrate())
+    return {
+        name: (
+            (value / calibration, CALIBRATED) if unit == "s" else (value, unit)
+        )
+        for name, (value, unit) in results.items()
+    }
+
+
+def compare(
+    results: Results, baselines: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Returns the names of the benchmarks whose result is more than
+    `tolerance` times their baseline."""
+    regressions = []
+    for name, (value, unit) in results.items():
+        baseline = baselines.get(name)
+        if baseline is not None and baseline.get("unit") != unit:
+            baseline = None  # Recorded in another unit, not comparable
+        ratio = value / baseline["value"] if baseline else None
+        regressed = ratio is not None and ratio > tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            "%-28s %12.4g %-6s %s%s"
+            % (
+                name,
+                value,
+                unit,
+                "(no baseline)" if ratio is None else "x%.2f" % ratio,
+                "  REGRESSION" if regressed else "",
+            )
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--baselines",
+        default=BASELINES_PATH,
+        help="file holding the baselines",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="ratio to the baseline above which a result fails the run",
+    )
+    parser.add_argument(
+        "--update-baselines",
+        action="store_true",
+        help="store the results as the new baselines",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmarks())
+
+    baselines: Dict[str, Any] = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, encoding="utf-8") as file:
+            baselines = json.load(file)
+
+    regressions = compare(results, baselines, args.tolerance)
+
+    if args.update_baselines:
+        with open(args.baselines, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    name: {"value": float("%.6g" % value), "unit": unit}
+                    for name, (value, unit) in results.items()
+                },
+                file,
+                indent=4,
+                sort_keys=True,
+            )
+            file.write("\n")
+        return 0
+
+    if regressions:
+        print("regressed: %s" % ", ".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""A local stand-in of the AGSI/ALSI API serving fixed payloads"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from aiohttp import web
+
+
+async def start_server(
+    responses: Dict[str, List[Dict[str, Any]]],
+) -> Tuple[web.AppRunner, str]:
+    """Starts a server answering GET requests of every path with the
+    page given by the `page` param of the pages of that path.
+
+    Parameters
+    ----------
+    responses : Dict[str, List[Dict[str, Any]]]
+        The pages served under every path, e.g. "/api/"
+
+    Returns
+    -------
+    Tuple[web.AppRunner, str]
+        The runner, to be cleaned up once done, and the root URL of
+        the server
+    """
+    bodies = {
+        path: [json.dumps(page).encode("utf-8") for page in path_pages]
+        for path, path_pages in responses.items()
+    }
+
+    async def handler(request: web.Request) -> web.Response:
+        path_bodies = bodies.get(request.path)
+        if path_bodies is None:
+            raise web.HTTPNotFound()
+
+        page = int(request.query.get("page", 1))
+        if not 1 <= page <= len(path_bodies):
+            return web.json_response({"last_page": 0, "data": []})
+        return web.Response(
+            body=path_bodies[page - 1], content_type="application/json"
+        )
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    host, port = runner.addresses[0][:2]
+    return runner, "http://%s:%s" % (host, port)
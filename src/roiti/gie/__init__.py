@@ -1,4 +1,41 @@
 __version__ = "0.0.1"
 
-from .gie_pandas_client import GiePandasClient
-from .gie_raw_client import GieRawClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .gie_arrow_client import GieArrowClient
+    from .gie_pandas_client import GiePandasClient
+    from .gie_polars_client import GiePolarsClient
+    from .gie_raw_client import GieRawClient
+    from .gie_sync_client import GieSyncClient
+    from .gie_sync_store import GieSyncStore
+
+# The clients are imported on first access (PEP 562), so that importing
+# the package does not load aiohttp, pandas or the mapping enums
+_LAZY_ATTRIBUTES = {
+    "GieArrowClient": ".gie_arrow_client",
+    "GiePandasClient": ".gie_pandas_client",
+    "GiePolarsClient": ".gie_polars_client",
+    "GieRawClient": ".gie_raw_client",
+    "GieSyncClient": ".gie_sync_client",
+    "GieSyncStore": ".gie_sync_store",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,288 @@
+"""Caches for the API responses"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def cache_key(url: str, params: Dict[str, Any]) -> str:
+    """Builds the normalized cache key of a request.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the request, holding the API type and the endpoint
+    params : Dict[str, Any]
+        The query string params of the request
+
+    Returns
+    -------
+    str
+        The key, equal for requests which only differ in param order
+    """
+    normalized = sorted((str(k), str(v)) for k, v in params.items())
+    return json.dumps([url, normalized], separators=(",", ":"))
+
+
+class CacheBackend:
+    """Base class of the response caches
+
+    The clients call the methods of a blocking cache, which does disk
+    I/O, in the default executor of the event loop, so they must be
+    safe to call from any thread.
+    """
+
+    blocking = True
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value of the key, None if it is missing
+        or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Stores the value of the key for `ttl` seconds, or forever if
+        `ttl` is None."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Removes every cached value."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _expires(ttl: Optional[float]) -> Optional[float]:
+        return None if ttl is None else time.time() + ttl
+
+    @staticmethod
+    def _expired(expires: Optional[float]) -> bool:
+        return expires is not None and expires <= time.time()
+
+
+class MemoryCache(CacheBackend):
+    """In-process least recently used cache.
+
+    The cached values are shared by everyone who reads them, so they
+    must not be modified.
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 60):
+        """Constructor method for the memory cache
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Number of responses kept before evicting the least recently used, by default 1024
+        ttl : Optional[float], optional
+            Maximum number of seconds a response is kept, or None for no maximum, by default 60
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer!")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if self._expired(expires):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        if self.ttl is not None:
+            ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+
+        self._entries[key] = (self._expires(ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class FileCache(CacheBackend):
+    """Cache storing every response in a gzipped JSON file"""
+
+    def __init__(self, directory: str):
+        """Constructor method for the file cache
+
+        Parameters
+        ----------
+        directory : str
+            The directory holding the cache files, created if missing
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".json.gz")
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("key") != key or self._expired(entry.get("expires")):
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        path = self._path(key)
+        tmp_path = "%s.%s.tmp" % (path, os.getpid())
+        entry = {"key": key, "expires": self._expires(ttl), "value": value}
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json.gz"):
+                os.remove(os.path.join(self.directory, name))
+
+
+class SQLiteCache(CacheBackend):
+    """Cache storing the responses in a SQLite database
+
+    The connection is shared by every thread, one query at a time.
+    """
+
+    def __init__(self, path: str):
+        """Constructor method for the SQLite cache
+
+        Parameters
+        ----------
+        path : str
+            The path of the database file, created if missing
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, expires REAL, value BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or self._expired(row[0]):
+            return None
+        return json.loads(gzip.decompress(row[1]).decode("utf-8"))
+
+    def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        blob = gzip.compress(json.dumps(value).encode("utf-8"))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, self._expires(ttl), blob),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachePolicy:
+    """Decides for how long the response of a request is cached.
+
+    Storage data whose latest gas day is older than the revision window
+    is not revised by GIE anymore, so it is cached forever. Everything
+    else expires after the TTL of its endpoint.
+    """
+
+    def __init__(
+        self,
+        revision_days: int = 60,
+        recent_ttl: Optional[float] = 3600,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """Constructor method for the cache policy
+
+        Parameters
+        ----------
+        revision_days : int, optional
+            Number of days during which GIE may still revise a gas day, by default 60
+        recent_ttl : Optional[float], optional
+            Seconds storage data of recent gas days is cached, by default 3600
+        endpoint_ttls : Optional[Dict[str, Optional[float]]], optional
+            Seconds the responses of other endpoints are cached, None for forever and
+            0 for never, by default 10 minutes for news, an hour for unavailability
+            and a day for the EIC listing
+        """
+        self.revision_days = revision_days
+        self.recent_ttl = recent_ttl
+        self.endpoint_ttls: Dict[str, Optional[float]] = {
+            "news": 600,
+            "unavailability": 3600,
+            "about": 86400,
+        }
+        if endpoint_ttls is not None:
+            self.endpoint_ttls.update(endpoint_ttls)
+
+    def ttl(self, url: str, params: Dict[str, Any]) -> Optional[float]:
+        """Returns for how long the response of a request is cached.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request
+        params : Dict[str, Any]
+            The query string params of the request
+
+        Returns
+        -------
+        Optional[float]
+            The number of seconds, None for forever and 0 for never
+        """
+        path = urllib.parse.urlsplit(url).path
+        endpoint = path.rsplit("/api/", 1)[-1].strip("/")
+        if endpoint:
+            return self.endpoint_ttls.get(endpoint, self.recent_ttl)
+
+        latest_day = self._to_date(params.get("date") or params.get("to"))
+        if latest_day is None:
+            return self.recent_ttl
+
+        age = datetime.date.today() - latest_day
+        if age.days > self.revision_days:
+            return None
+        return self.recent_ttl
+
+    @staticmethod
+    def _to_date(value: Any) -> Optional[datetime.date]:
+        if value is None:
+            return None
+        try:
+            return datetime.date.fromisoformat(str(value)[:10])
+        except ValueError:
+            return None
@@ -0,0 +1,57 @@
+"""Helpers for the connection pool of the clients' sessions"""
+
+import importlib.util
+from typing import Optional
+
+import aiohttp
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:  # aiohttp < 3.9 only decodes brotli through `brotli`
+    HAS_BROTLI = importlib.util.find_spec("brotli") is not None
+
+
+def create_connector(
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = 30.0,
+    ttl_dns_cache: Optional[int] = 300,
+) -> aiohttp.TCPConnector:
+    """Creates a pooled connector which can be shared by several clients.
+
+    Parameters
+    ----------
+    limit : int, optional
+        Maximum number of open connections, 0 for no limit, by default 100
+    limit_per_host : int, optional
+        Maximum number of open connections to the same host, 0 for no limit, by default 0
+    keepalive_timeout : float, optional
+        Seconds an idle connection is kept open for reuse, by default 30.0
+    ttl_dns_cache : Optional[int], optional
+        Seconds a DNS lookup is cached, or None to cache it forever, by default 300
+
+    Returns
+    -------
+    aiohttp.TCPConnector
+        The pooled connector
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+
+
+def accept_encoding() -> str:
+    """Returns the Accept-Encoding header value of the content
+    encodings which the installed aiohttp is able to decode.
+
+    Returns
+    -------
+    str
+        gzip and deflate, plus br when a brotli decoder is installed
+    """
+    if HAS_BROTLI:
+        return "gzip, deflate, br"
+    return "gzip, deflate"
@@ -0,0 +1,35 @@
+"""JSON decoders for the API responses"""
+
+import json
+from typing import Any, Callable
+
+JsonLoads = Callable[[bytes], Any]
+
+
+def default_json_loads() -> JsonLoads:
+    """Returns the fastest JSON decoder which is installed.
+
+    orjson is preferred, then msgspec, and the standard library `json`
+    module is the fallback. All of them decode the raw response bytes
+    in one step.
+
+    Returns
+    -------
+    JsonLoads
+        Function decoding JSON bytes to Python objects
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.decode
+
+    return json.loads
@@ -0,0 +1,426 @@
+"""A registry of the AGSI/ALSI operators and facilities, built from the
+live EIC listing"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .gie_raw_client import GieRawClient
+from .mappings.agsi_company import AGSICompany
+from .mappings.agsi_facility import AGSIFacility
+from .mappings.alsi_company import ALSICompany
+from .mappings.alsi_facility import ALSIFacility
+from .mappings.api_mappings import APIType
+
+_FIELDS = ("name", "short_name", "eic", "type", "url")
+
+# The mapping enums, used while no listing has been fetched yet
+_FALLBACK_ENUMS = (
+    (APIType.AGSI, AGSICompany, AGSIFacility),
+    (APIType.ALSI, ALSICompany, ALSIFacility),
+)
+
+
+def listing_records(listing: Any) -> List[Dict[str, Any]]:
+    """Flattens the nested EIC listing into one record per operator
+    and facility.
+
+    Parameters
+    ----------
+    listing : Any
+        The listing, operators grouped by type, region and country,
+        each holding its facilities
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        The operators and facilities, with the EIC of the operator
+        of each facility as `parent_eic`
+    """
+    records = []
+    stack: List[Any] = [(listing, None, None)]
+    while stack:
+        node, country, parent_eic = stack.pop()
+        if isinstance(node, list):
+            stack.extend(
+                (item, country, parent_eic) for item in reversed(node)
+            )
+        elif isinstance(node, dict) and "eic" in node:
+            node_country = node.get("country")
+            if isinstance(node_country, dict):
+                node_country = node_country.get("code")
+            record = {key: node.get(key) for key in _FIELDS}
+            record["country"] = node_country or country
+            record["parent_eic"] = parent_eic
+            records.append(record)
+            stack.append(
+                (node.get("facilities"), record["country"], node["eic"])
+            )
+        elif isinstance(node, dict):
+            stack.extend(
+                (
+                    value,
+                    key if len(key) == 2 and key.isupper() else country,
+                    parent_eic,
+                )
+                for key, value in reversed(list(node.items()))
+            )
+
+    return records
+
+
+def _normalize(value: str) -> str:
+    return value.strip().casefold()
+
+
+def _api_name(api_type: Union[APIType, str]) -> str:
+    return api_type.name if isinstance(api_type, APIType) else api_type
+
+
+class RegistryEntity:
+    """An operator or facility of the registry, usable wherever the
+    clients take a company or facility member of the mapping enums"""
+
+    def __init__(self, record: Dict[str, Any]):
+        """Constructor method for the registry entity
+
+        Parameters
+        ----------
+        record : Dict[str, Any]
+            The record of the registry
+        """
+        self.record = record
+        self.name: str = record.get("name") or record["eic"]
+        self.code: str = record["eic"]
+        self.country: Optional[str] = record.get("country")
+        #: The EIC of the operator of a facility, None for an operator
+        self.company: Optional[str] = record.get("parent_eic")
+        self.api: str = record["api"]
+
+    def get_params(self) -> Dict[str, str]:
+        """Returns the query string params of the entity, like
+        `get_params` of the mapping enums."""
+        params = {"country": self.country, "company": self.code}
+        if self.company is not None:
+            params["company"] = self.company
+            params["facility"] = self.code
+        return {k: v for k, v in params.items() if v is not None}
+
+    def __str__(self) -> str:
+        return self.code
+
+    def __repr__(self) -> str:
+        return "RegistryEntity(%s %s %r)" % (self.api, self.code, self.name)
+
+
+class EICRegistry:
+    """Registry of the operators and facilities of AGSI and ALSI,
+    indexed by EIC, name and country.
+
+    The registry is filled from the EIC listing of both APIs and the
+    listing is kept in a gzipped JSON file, which is only fetched again
+    once it is older than the refresh interval. Until a listing has
+    been fetched or loaded, the registry is filled from the mapping
+    enums, whose member names are used as the names.
+
+    Every record holds the `name`, `short_name`, `eic`, `type`, `url`
+    and `country` of the listing, the `parent_eic` of the operator of
+    a facility (None for operators) and the `api`, "AGSI" or "ALSI".
+    An EIC or name listed by both APIs is ambiguous unless `api_type`
+    is given. Pass the registry to `lookup_functions.set_registry` to
+    make the `lookup_*` functions, and so the `query_*` methods of the
+    clients, fall back to it for keys missing from the mapping enums.
+    """
+
+    def __init__(
+        self,
+        client: GieRawClient,
+        path: Optional[str] = None,
+        refresh_interval: float = 86400,
+    ):
+        """Constructor method for the registry
+
+        Parameters
+        ----------
+        client : GieRawClient
+            The async client used for querying the EIC listing, any of the async clients works.
+            `GieSyncClient` does not, as `refresh` is awaited on the loop of the caller
+
+        Raises
+        ------
+        TypeError
+            If the client is not an async client
+        path : Optional[str], optional
+            The file the listing is kept in, or keep it in memory only if None, by default None
+        refresh_interval : float, optional
+            Seconds after which the listing is fetched again, by default a day
+        """
+        if not isinstance(client, GieRawClient):
+            raise TypeError(
+                "EICRegistry needs an async client such as GieRawClient, "
+                "got %s!" % type(client).__name__
+            )
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.client = client
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.fetched_at: Optional[float] = None
+
+        # Normalized EIC or name -> api -> record
+        self._by_eic: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_name: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_country: Dict[str, List[Dict[str, Any]]] = {}
+
+        if not self._load():
+            self._index(self._fallback_records())
+
+    @property
+    def stale(self) -> bool:
+        """Whether the listing is missing or older than the refresh
+        interval."""
+        return (
+            self.fetched_at is None
+            or time.time() - self.fetched_at >= self.refresh_interval
+        )
+
+    async def refresh(self, force: bool = False) -> bool:
+        """Fetches the EIC listings of AGSI and ALSI when the registry
+        is stale, and stores them in the file of the registry.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Fetch the listings even if the registry is fresh, by default False
+
+        Returns
+        -------
+        bool
+            Whether the listings were fetched
+        """
+        if not force and not self.stale:
+            return False
+
+        self._logger.info("refreshing the EIC registry..")
+        records = []
+        for api_type in (APIType.AGSI, APIType.ALSI):
+            listing = await self.client.fetch(api_type, "about?show=listing")
+            for record in listing_records(listing):
+                record["api"] = api_type.name
+                records.append(record)
+
+        self.fetched_at = time.time()
+        self._index(records)
+        if self.path is not None:
+            self._save(records)
+        return True
+
+    def get(
+        self, key: str, api_type: Optional[Union[APIType, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the operator or facility whose EIC, name or short
+        name is the key, ignoring case and surrounding whitespace.
+
+        Parameters
+        ----------
+        key : str
+            The EIC or name
+        api_type : Optional[Union[APIType, str]], optional
+            Only return the record of APIType.AGSI or APIType.ALSI, by default either
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The record, None if there is none
+
+        Raises
+        ------
+        ValueError
+            If `api_type` is None and both APIs list the key.
+        """
+        record = self.by_eic(key, api_type)
+        if record is None:
+            record = self.by_name(key, api_type)
+        return record
+
+    def by_eic(
+        self, eic: str, api_type: Optional[Union[APIType, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the operator or facility of an EIC, None if there is
+        none, like `get`."""
+        return self._select(self._by_eic, eic, api_type)
+
+    def by_name(
+        self, name: str, api_type: Optional[Union[APIType, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the operator or facility of a name or short name,
+        None if there is none, like `get`."""
+        return self._select(self._by_name, name, api_type)
+
+    def lookup(
+        self, key: str, api_type: Union[APIType, str], facility: bool
+    ) -> Optional[RegistryEntity]:
+        """Returns the facility, or the operator, of an API whose EIC
+        or name is the key, None if there is none.
+
+        Parameters
+        ----------
+        key : str
+            The EIC or name
+        api_type : Union[APIType, str]
+            APIType.AGSI or APIType.ALSI
+        facility : bool
+            Look for a facility, or for an operator if False
+
+        Returns
+        -------
+        Optional[RegistryEntity]
+            The entity, None if there is none
+        """
+        record = self.get(key, api_type)
+        if record is None or (record["parent_eic"] is not None) != facility:
+            return None
+        return RegistryEntity(record)
+
+    def by_country(
+        self, country: str, api_type: Optional[Union[APIType, str]] = None
+    ) -> Sequence[Dict[str, Any]]:
+        """Returns the operators and facilities of a country.
+
+        Parameters
+        ----------
+        country : str
+            The country code, e.g. "DE"
+        api_type : Optional[Union[APIType, str]], optional
+            Only return the records of APIType.AGSI or APIType.ALSI, by default both
+
+        Returns
+        -------
+        Sequence[Dict[str, Any]]
+            The records, in the order of the listing
+        """
+        records = self._by_country.get(country.strip().upper(), [])
+        if api_type is None:
+            return tuple(records)
+
+        api = _api_name(api_type)
+        return tuple(record for record in records if record["api"] == api)
+
+    def get_params(
+        self, key: str, api_type: Optional[Union[APIType, str]] = None
+    ) -> Dict[str, str]:
+        """Returns the query string params of an operator or facility,
+        like `get_params` of the mapping enums, to be passed to `fetch`
+        of the API of the record.
+
+        Raises
+        ------
+        ValueError
+            If `key` is not a known EIC or name, or if `api_type` is None
+            and both APIs list it.
+        """
+        record = self.get(key, api_type)
+        if record is None:
+            raise ValueError("The EIC or name %r is unknown!" % (key,))
+        return RegistryEntity(record).get_params()
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._by_eic.values())
+
+    @staticmethod
+    def _select(
+        index: Dict[str, Dict[str, Dict[str, Any]]],
+        key: str,
+        api_type: Optional[Union[APIType, str]],
+    ) -> Optional[Dict[str, Any]]:
+        records = index.get(_normalize(key))
+        if not records:
+            return None
+        if api_type is not None:
+            return records.get(_api_name(api_type))
+        if len(records) > 1:
+            raise ValueError(
+                "Both AGSI and ALSI list %r, pass the api_type!" % (key,)
+            )
+        return next(iter(records.values()))
+
+    def _index(self, records: List[Dict[str, Any]]) -> None:
+        by_eic: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        by_name: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        by_country: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            if not record.get("eic"):
+                continue
+            api = record["api"]
+            by_eic.setdefault(_normalize(record["eic"]), {}).setdefault(
+                api, record
+            )
+            for name in (record.get("name"), record.get("short_name")):
+                if name:
+                    by_name.setdefault(_normalize(name), {}).setdefault(
+                        api, record
+                    )
+            if record.get("country"):
+                by_country.setdefault(record["country"], []).append(record)
+
+        self._by_eic = by_eic
+        self._by_name = by_name
+        self._by_country = by_country
+
+    @staticmethod
+    def _fallback_records() -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        for api_type, company_type, facility_type in _FALLBACK_ENUMS:
+            for company in company_type:
+                records.append(
+                    {
+                        "name": company.name,
+                        "short_name": None,
+                        "eic": company.code,
+                        "type": None,
+                        "url": None,
+                        "country": company.country,
+                        "parent_eic": None,
+                        "api": api_type.name,
+                    }
+                )
+            for facility in facility_type:
+                records.append(
+                    {
+                        "name": facility.name,
+                        "short_name": None,
+                        "eic": facility.code,
+                        "type": None,
+                        "url": None,
+                        "country": facility.country,
+                        "parent_eic": facility.company,
+                        "api": api_type.name,
+                    }
+                )
+        return records
+
+    def _load(self) -> bool:
+        """Loads the listing from the file of the registry, whatever
+        its age, and returns whether it was found."""
+        if self.path is None:
+            return False
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        self.fetched_at = entry["fetched_at"]
+        self._index(entry["records"])
+        return True
+
+    def _save(self, records: List[Dict[str, Any]]) -> None:
+        assert self.path is not None
+        tmp_path = "%s.%s.tmp" % (self.path, os.getpid())
+        entry = {"fetched_at": self.fetched_at, "records": records}
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, self.path)
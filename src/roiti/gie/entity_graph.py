@@ -0,0 +1,213 @@
+"""An offline index of the countries, companies and facilities of the
+mapping enums"""
+
+from typing import Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+
+from .lookup_functions import lookup_many
+from .mappings.agsi_company import AGSICompany
+from .mappings.agsi_country import AGSICountry
+from .mappings.agsi_facility import AGSIFacility
+from .mappings.alsi_company import ALSICompany
+from .mappings.alsi_country import ALSICountry
+from .mappings.alsi_facility import ALSIFacility
+
+CountryT = TypeVar("CountryT", AGSICountry, ALSICountry)
+CompanyT = TypeVar("CompanyT", AGSICompany, ALSICompany)
+FacilityT = TypeVar("FacilityT", AGSIFacility, ALSIFacility)
+
+
+class EntityGraph(Generic[CountryT, CompanyT, FacilityT]):
+    """Immutable graph country -> companies -> facilities of one API,
+    built once from the mapping enums.
+
+    A facility belongs to the country it is located in, which is not
+    always the country its company is registered in, so a company is
+    listed under its own country and under every country it operates
+    a facility in. The members returned can be passed straight to the
+    `query_*_many` methods of the clients.
+    """
+
+    def __init__(
+        self,
+        country_type: Type[CountryT],
+        company_type: Type[CompanyT],
+        facility_type: Type[FacilityT],
+    ):
+        """Constructor method for the entity graph
+
+        Parameters
+        ----------
+        country_type : Type[CountryT]
+            The country enum, e.g. AGSICountry
+        company_type : Type[CompanyT]
+            The company enum, e.g. AGSICompany
+        facility_type : Type[FacilityT]
+            The facility enum, e.g. AGSIFacility
+        """
+        self.country_type: Type[CountryT] = country_type
+        self.company_type: Type[CompanyT] = company_type
+        self.facility_type: Type[FacilityT] = facility_type
+
+        countries_by_code: Dict[str, CountryT] = {
+            country.code: country for country in country_type
+        }
+        companies_by_code: Dict[str, CompanyT] = {
+            company.code: company for company in company_type
+        }
+
+        companies: Dict[CountryT, List[CompanyT]] = {
+            country: [] for country in country_type
+        }
+        facilities_by_country: Dict[CountryT, List[FacilityT]] = {
+            country: [] for country in country_type
+        }
+        facilities_by_company: Dict[CompanyT, List[FacilityT]] = {
+            company: [] for company in company_type
+        }
+        company_of: Dict[FacilityT, CompanyT] = {}
+
+        for company in company_type:
+            country = countries_by_code.get(company.country)
+            if country is not None:
+                companies[country].append(company)
+
+        for facility in facility_type:
+            country = countries_by_code.get(facility.country)
+            operator = companies_by_code.get(facility.company)
+            if country is not None:
+                facilities_by_country[country].append(facility)
+                if operator is not None and operator not in companies[country]:
+                    companies[country].append(operator)
+            if operator is not None:
+                facilities_by_company[operator].append(facility)
+                company_of[facility] = operator
+
+        self._companies: Dict[CountryT, Tuple[CompanyT, ...]] = {
+            k: tuple(v) for k, v in companies.items()
+        }
+        self._facilities_by_country: Dict[CountryT, Tuple[FacilityT, ...]] = {
+            k: tuple(v) for k, v in facilities_by_country.items()
+        }
+        self._facilities_by_company: Dict[CompanyT, Tuple[FacilityT, ...]] = {
+            k: tuple(v) for k, v in facilities_by_company.items()
+        }
+        self._company_of: Dict[FacilityT, CompanyT] = company_of
+
+    def countries(self) -> Tuple[CountryT, ...]:
+        """Returns the countries which have at least one company or
+        facility, in the order of the country enum."""
+        return tuple(
+            country
+            for country in self.country_type
+            if self._companies[country] or self._facilities_by_country[country]
+        )
+
+    def companies(
+        self, country: Optional[Union[CountryT, str]] = None
+    ) -> Tuple[CompanyT, ...]:
+        """Returns the companies of a country, or all the companies.
+
+        Parameters
+        ----------
+        country : Optional[Union[CountryT, str]], optional
+            The country, as a member, name or code, by default None
+
+        Returns
+        -------
+        Tuple[CompanyT, ...]
+            The companies registered in the country or operating a
+            facility in it
+
+        Raises
+        ------
+        ValueError
+            If `country` does not represent a valid country.
+        """
+        if country is None:
+            return tuple(self.company_type)
+        return self._companies[self._lookup(country, self.country_type)]
+
+    def facilities(
+        self,
+        country: Optional[Union[CountryT, str]] = None,
+        company: Optional[Union[CompanyT, str]] = None,
+    ) -> Tuple[FacilityT, ...]:
+        """Returns the facilities of a country and/or a company, or all
+        the facilities.
+
+        Parameters
+        ----------
+        country : Optional[Union[CountryT, str]], optional
+            The country the facilities are located in, by default None
+        company : Optional[Union[CompanyT, str]], optional
+            The company operating the facilities, by default None
+
+        Returns
+        -------
+        Tuple[FacilityT, ...]
+            The facilities matching both filters, in the order of the
+            facility enum
+
+        Raises
+        ------
+        ValueError
+            If `country` or `company` are invalid.
+        """
+        if country is None and company is None:
+            return tuple(self.facility_type)
+
+        if company is None:
+            return self._facilities_by_country[
+                self._lookup(country, self.country_type)
+            ]
+
+        facilities = self._facilities_by_company[
+            self._lookup(company, self.company_type)
+        ]
+        if country is None:
+            return facilities
+
+        country_member = self._lookup(country, self.country_type)
+        return tuple(
+            facility
+            for facility in facilities
+            if facility.country == country_member.code
+        )
+
+    def company_of(
+        self, facility: Union[FacilityT, str]
+    ) -> Optional[CompanyT]:
+        """Returns the company operating a facility, None if the
+        company is missing from the company enum.
+
+        Raises
+        ------
+        ValueError
+            If `facility` does not represent a valid facility.
+        """
+        return self._company_of.get(self._lookup(facility, self.facility_type))
+
+    @staticmethod
+    def _lookup(key, enum_type):
+        # The graph only holds the members of the enums
+        return lookup_many([key], enum_type, use_registry=False)[0]
+
+
+_AGSI_GRAPH: Optional[EntityGraph] = None
+_ALSI_GRAPH: Optional[EntityGraph] = None
+
+
+def agsi_graph() -> "EntityGraph[AGSICountry, AGSICompany, AGSIFacility]":
+    """Returns the entity graph of AGSI, built on the first call."""
+    global _AGSI_GRAPH
+    if _AGSI_GRAPH is None:
+        _AGSI_GRAPH = EntityGraph(AGSICountry, AGSICompany, AGSIFacility)
+    return _AGSI_GRAPH
+
+
+def alsi_graph() -> "EntityGraph[ALSICountry, ALSICompany, ALSIFacility]":
+    """Returns the entity graph of ALSI, built on the first call."""
+    global _ALSI_GRAPH
+    if _ALSI_GRAPH is None:
+        _ALSI_GRAPH = EntityGraph(ALSICountry, ALSICompany, ALSIFacility)
+    return _ALSI_GRAPH
@@ -7,3 +7,7 @@ class NoMatchingDataError(Exception):
 
 class ApiError(Exception):
     """Custom built exception for errors with the API"""
+
+
+class CassetteMissError(Exception):
+    """Custom built exception for requests missing from a replayed cassette"""
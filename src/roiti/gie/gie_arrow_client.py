@@ -0,0 +1,1317 @@
+"""AGSI/ALSI client returning Apache Arrow tables"""
+
+import datetime
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as error:
+    raise ImportError(
+        "GieArrowClient requires pyarrow, "
+        "install it with `pip install roiti-gie[arrow]`"
+    ) from error
+
+from .eic_registry import listing_records
+from .gie_raw_client import GieRawClient
+from .mappings.agsi_company import AGSICompany
+from .mappings.agsi_country import AGSICountry
+from .mappings.agsi_facility import AGSIFacility
+from .mappings.alsi_company import ALSICompany
+from .mappings.alsi_country import ALSICountry
+from .mappings.alsi_facility import ALSIFacility
+
+_FLOAT = pa.float64()
+_DATE = pa.date32()
+_TIMESTAMP = pa.timestamp("s")
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+_STRING = pa.string()
+
+
+class GieArrowClient(GieRawClient):
+    """AGSI/ALSI Arrow Client which queries the API and returns the data
+    as `pyarrow.Table` objects, and the pages of a result as a stream of
+    `pyarrow.RecordBatch` objects.
+
+    Every endpoint has a schema holding its known fields, which are
+    always present, null where the API does not return them. The other
+    fields of the first page are appended as strings, nested objects
+    encoded as JSON, except the {"lng", "gwh"} objects of ALSI, which
+    are split into float fields such as `inventory_lng` and
+    `inventory_gwh`. The schema is kept for the following pages, so
+    every batch of a stream can be written to the same Parquet file.
+    """
+
+    _STORAGE_FIELDS = {
+        "name": _STRING,
+        "code": _CATEGORY,
+        "url": _STRING,
+        "gasDayStart": _DATE,
+        "gasDayEnd": _DATE,
+        "gasInStorage": _FLOAT,
+        "consumption": _FLOAT,
+        "consumptionFull": _FLOAT,
+        "injection": _FLOAT,
+        "withdrawal": _FLOAT,
+        "netWithdrawal": _FLOAT,
+        "workingGasVolume": _FLOAT,
+        "injectionCapacity": _FLOAT,
+        "withdrawalCapacity": _FLOAT,
+        "status": _CATEGORY,
+        "trend": _FLOAT,
+        "full": _FLOAT,
+    }
+
+    _LNG_FIELDS = {
+        "name": _STRING,
+        "code": _CATEGORY,
+        "url": _STRING,
+        "gasDayStart": _DATE,
+        "gasDayEnd": _DATE,
+        "inventory_lng": _FLOAT,
+        "inventory_gwh": _FLOAT,
+        "sendOut": _FLOAT,
+        "dtmi_lng": _FLOAT,
+        "dtmi_gwh": _FLOAT,
+        "dtrs": _FLOAT,
+        "status": _CATEGORY,
+        "trend": _FLOAT,
+        "full": _FLOAT,
+    }
+
+    _UNAVAILABILITY_FIELDS = {
+        "name": _STRING,
+        "code": _CATEGORY,
+        "volume": _FLOAT,
+    }
+
+    _EIC_FIELDS = {
+        "name": _STRING,
+        "short_name": _STRING,
+        "eic": _STRING,
+        "type": _CATEGORY,
+        "country": _CATEGORY,
+        "parent_eic": _STRING,
+        "url": _STRING,
+    }
+
+    _NEWS_FIELDS: Dict[str, pa.DataType] = {}
+
+    # Fields read from the keys of the nested {"lng": ..., "gwh": ...}
+    # objects of ALSI, as (field of the record, key of the object)
+    _NESTED_FIELDS = {
+        "inventory_lng": ("inventory", "lng"),
+        "inventory_gwh": ("inventory", "gwh"),
+        "dtmi_lng": ("dtmi", "lng"),
+        "dtmi_gwh": ("dtmi", "gwh"),
+    }
+
+    # Types of the fields which are not part of an endpoint schema
+    _EXTRA_FIELDS = {
+        "gas_day": _DATE,
+        "updatedAt": _TIMESTAMP,
+        "entity_code": _CATEGORY,
+    }
+
+    def __init__(self, *args: Any, float_dtype: str = "float64", **kwargs):
+        """Constructor method for our client
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The parameters of `GieRawClient`
+        float_dtype : str, optional
+            Arrow type of the floating columns, "float32" halves their memory, by default "float64"
+        """
+        self.float_dtype = float_dtype
+        super().__init__(*args, **kwargs)
+
+    @property
+    def float_dtype(self) -> str:
+        return self._float_dtype
+
+    @float_dtype.setter
+    def float_dtype(self, value: str) -> None:
+        float_type = pa.type_for_alias(value)
+        if not pa.types.is_floating(float_type):
+            raise ValueError("float_dtype must be a floating type!")
+        self._float_dtype = value
+        self._float_type = float_type
+
+    def _arrow_table(
+        self, json_res: Any, fields: Dict[str, pa.DataType]
+    ) -> pa.Table:
+        """Transforms the json data of a result to a pyarrow Table
+
+        Parameters
+        ----------
+        json_res : Any
+            Raw data in a Dict format
+        fields : Dict[str, pa.DataType]
+            The known fields of the endpoint and their types
+
+        Returns
+        -------
+        pa.Table
+            Table holding the queried data
+        """
+        gas_day = None
+        if isinstance(json_res, dict) and "data" in json_res:
+            gas_day = json_res.get("gas_day")
+            records = json_res["data"]
+        else:
+            records = json_res
+
+        if not isinstance(records, list):
+            records = []
+
+        batch = self._record_batch(records, fields, gas_day=gas_day)
+        return pa.Table.from_batches([batch])
+
+    def _record_batch(
+        self,
+        records: List[Dict[str, Any]],
+        fields: Dict[str, pa.DataType],
+        schema: Optional[pa.Schema] = None,
+        gas_day: Optional[str] = None,
+    ) -> pa.RecordBatch:
+        """Builds a record batch, one column at a time.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]]
+            The records of a page
+        fields : Dict[str, pa.DataType]
+            The known fields of the endpoint and their types
+        schema : Optional[pa.Schema], optional
+            Schema of the previous batches of the stream, by default the
+            schema is built from the fields and the records
+        gas_day : Optional[str], optional
+            Gas day of a result queried by date, added as a column
+
+        Returns
+        -------
+        pa.RecordBatch
+            The batch holding the records
+        """
+        records = [record for record in records if isinstance(record, dict)]
+        if schema is None:
+            schema = self._schema(records, fields, gas_day is not None)
+
+        columns = self._string_columns(
+            records, [name for name in schema.names if name != "gas_day"]
+        )
+        if gas_day is not None:
+            columns["gas_day"] = pa.array(
+                [gas_day] * len(records), type=_STRING
+            )
+
+        arrays = []
+        for field in schema:
+            strings = columns.get(field.name)
+            if strings is None:
+                strings = pa.nulls(len(records), type=_STRING)
+            arrays.append(self._array(strings, field.type))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def _string_columns(
+        self, records: List[Dict[str, Any]], names: List[str]
+    ) -> Dict[str, pa.Array]:
+        """Transposes the records into one string array per column.
+
+        The columns holding strings in the first record are transposed
+        by Arrow in one step, the others value by value. The fields of
+        `_NESTED_FIELDS` are read from the nested objects.
+        """
+        first = records[0] if records else {}
+        plain = [
+            name
+            for name in names
+            if name not in self._NESTED_FIELDS
+            and (first.get(name) is None or isinstance(first[name], str))
+        ]
+
+        columns: Dict[str, pa.Array] = {}
+        try:
+            struct = pa.array(
+                records, type=pa.struct([(name, _STRING) for name in plain])
+            )
+            columns.update(zip(plain, struct.flatten()))
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            pass
+
+        for name in names:
+            if name in columns:
+                continue
+            if name in self._NESTED_FIELDS:
+                parent, key = self._NESTED_FIELDS[name]
+                values = [record.get(parent) for record in records]
+                columns[name] = self._string_array(
+                    [
+                        value.get(key) if isinstance(value, dict) else None
+                        for value in values
+                    ]
+                )
+            else:
+                columns[name] = self._string_array(
+                    [record.get(name) for record in records]
+                )
+
+        return columns
+
+    def _schema(
+        self,
+        records: List[Dict[str, Any]],
+        fields: Dict[str, pa.DataType],
+        with_gas_day: bool = False,
+    ) -> pa.Schema:
+        """Builds the schema of a stream from the known fields of its
+        endpoint and the other fields of its first records."""
+        types = {"gas_day": _DATE} if with_gas_day else {}
+        types.update(fields)
+        nested = {
+            parent
+            for name, (parent, _) in self._NESTED_FIELDS.items()
+            if name in fields
+        }
+        for key in dict.fromkeys(key for record in records for key in record):
+            if key not in types and key not in nested:
+                types[key] = self._EXTRA_FIELDS.get(key, _STRING)
+
+        return pa.schema(
+            [
+                (name, self._float_type if data_type == _FLOAT else data_type)
+                for name, data_type in types.items()
+            ]
+        )
+
+    def _array(self, strings: pa.Array, data_type: pa.DataType) -> pa.Array:
+        """Converts the string values of a column to an array of its type.
+
+        Numbers and dates are parsed by Arrow in one step. When a
+        column holds placeholders such as "-", which Arrow can not
+        parse, only the values which are not valid become null.
+        """
+        if data_type == _STRING:
+            return strings
+        if data_type == _CATEGORY:
+            return pc.dictionary_encode(strings).cast(data_type)
+
+        try:
+            return pc.cast(strings, data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+
+        if pa.types.is_floating(data_type):
+            valid = pc.match_substring_regex(
+                strings, r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+            )
+            return pc.cast(
+                pc.if_else(valid, strings, pa.scalar(None, _STRING)),
+                data_type,
+            )
+
+        parse = (
+            datetime.date.fromisoformat
+            if data_type == _DATE
+            else datetime.datetime.fromisoformat
+        )
+        parsed = []
+        for value in strings.to_pylist():
+            try:
+                parsed.append(parse(value) if value else None)
+            except ValueError:
+                parsed.append(None)
+        return pa.array(parsed, type=data_type)
+
+    @staticmethod
+    def _gas_day(records: List[Dict[str, Any]]) -> Optional[str]:
+        """Returns the gas day of the page of the records, if any."""
+        return getattr(records, "gas_day", None)
+
+    @staticmethod
+    def _string_array(values: List[Any]) -> pa.Array:
+        """Converts the values of a column to a string array, encoding
+        nested objects as JSON."""
+        try:
+            return pa.array(values, type=_STRING)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            pass
+
+        return pa.array(
+            [
+                (
+                    value
+                    if value is None or isinstance(value, str)
+                    else (
+                        json.dumps(value)
+                        if isinstance(value, (dict, list))
+                        else str(value)
+                    )
+                )
+                for value in values
+            ],
+            type=_STRING,
+        )
+
+    async def query_agsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> pa.Table:
+        """Return all the AGSI EIC (Energy Identification Code) listing
+
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding the queried data
+
+        """
+        json_result = await super().query_agsi_eic_listing(all_pages=all_pages)
+        return self._arrow_table(
+            listing_records(json_result), self._EIC_FIELDS
+        )
+
+    async def query_alsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> pa.Table:
+        """Return all the ALSI EIC (Energy Identification Code) listing
+
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding the queried data
+
+        """
+        json_result = await super().query_alsi_eic_listing(all_pages=all_pages)
+        return self._arrow_table(
+            listing_records(json_result), self._EIC_FIELDS
+        )
+
+    async def query_alsi_news_listing(
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return all the ALSI news or a specific country news listings
+
+        Parameters
+        ----------
+        news_url_item : Optional[Union[int, str]], optional
+           An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding the queried data
+        """
+        json_result = await super().query_alsi_news_listing(
+            news_url_item=news_url_item, all_pages=all_pages
+        )
+        return self._arrow_table(json_result, self._NEWS_FIELDS)
+
+    async def query_agsi_news_listing(
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return all the AGSI news or a specific country news listings
+
+        Parameters
+        ----------
+        news_url_item : Optional[Union[int, str]], optional
+           An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding the queried data
+        """
+        json_result = await super().query_agsi_news_listing(
+            news_url_item=news_url_item, all_pages=all_pages
+        )
+        return self._arrow_table(json_result, self._NEWS_FIELDS)
+
+    async def query_country_agsi_storage(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return listing with the AGSI storage data for a
+           specific country or all countries
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional starting date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+            Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+           Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_country_agsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_country_alsi_storage(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return listing with the ALSI storage data for
+           a specific country or all countries
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+           Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_country_alsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def query_agsi_facility_storage(
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return listing with the AGSI data for a specific facility storage
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_agsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_alsi_facility_storage(
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Return listing with the ALSI data for a specific facility storage
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_alsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def query_agsi_company(
+        self,
+        company_name: Union[AGSICompany, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the AGSI data for a specific company
+
+        Parameters
+        ----------
+        company_name : Union[AGSICompany, str]
+            The name of the company to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_agsi_company(
+            company_name=company_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_alsi_company(
+        self,
+        company_name: Union[ALSICompany, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the ALSI data for a specific company
+
+        Parameters
+        ----------
+        company_name : Union[ALSICompany, str]
+            The name of the company to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_alsi_company(
+            company_name=company_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def query_agsi_unavailability(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns the total AGSI unavailability data or
+           a specific country unavailability
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_agsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._UNAVAILABILITY_FIELDS)
+
+    async def query_alsi_unavailability(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns the total ALSI unavailability data or
+           a specific country unavailability
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data
+        """
+        json_result = await super().query_alsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._UNAVAILABILITY_FIELDS)
+
+    async def query_country_agsi_storage_many(
+        self,
+        countries: Sequence[Union[AGSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the AGSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[AGSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_country_agsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_country_alsi_storage_many(
+        self,
+        countries: Sequence[Union[ALSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the ALSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[ALSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_country_alsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def query_agsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[AGSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the AGSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[AGSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_agsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_alsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[ALSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the ALSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[ALSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_alsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def query_agsi_company_many(
+        self,
+        companies: Sequence[Union[AGSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the AGSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[AGSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_agsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._STORAGE_FIELDS)
+
+    async def query_alsi_company_many(
+        self,
+        companies: Sequence[Union[ALSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pa.Table:
+        """Returns listing with the ALSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[ALSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pa.Table
+            Table holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_alsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._arrow_table(json_result, self._LNG_FIELDS)
+
+    async def iter_country_agsi_storage(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the AGSI storage data for
+           a specific country or all countries,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_country_agsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records, self._STORAGE_FIELDS, schema, self._gas_day(records)
+            )
+            schema = batch.schema
+            yield batch
+
+    async def iter_country_alsi_storage(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the ALSI storage data for
+           a specific country or all countries,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_country_alsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records, self._LNG_FIELDS, schema, self._gas_day(records)
+            )
+            schema = batch.schema
+            yield batch
+
+    async def iter_agsi_facility_storage(
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the AGSI data for
+           a specific facility storage,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_agsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records, self._STORAGE_FIELDS, schema, self._gas_day(records)
+            )
+            schema = batch.schema
+            yield batch
+
+    async def iter_alsi_facility_storage(
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the ALSI data for
+           a specific facility storage,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_alsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records, self._LNG_FIELDS, schema, self._gas_day(records)
+            )
+            schema = batch.schema
+            yield batch
+
+    async def iter_agsi_unavailability(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the total AGSI unavailability
+           data or a specific country unavailability,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_agsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records,
+                self._UNAVAILABILITY_FIELDS,
+                schema,
+                self._gas_day(records),
+            )
+            schema = batch.schema
+            yield batch
+
+    async def iter_alsi_unavailability(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterates over the pages of the total ALSI unavailability
+           data or a specific country unavailability,
+           yielding a RecordBatch for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pa.RecordBatch
+            Batch holding the records of each page
+        """
+        schema = None
+        async for records in super().iter_alsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            batch = self._record_batch(
+                records,
+                self._UNAVAILABILITY_FIELDS,
+                schema,
+                self._gas_day(records),
+            )
+            schema = batch.schema
+            yield batch
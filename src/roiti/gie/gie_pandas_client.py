@@ -1,6 +1,19 @@
+import contextlib
 import datetime
-from typing import Dict, Union, Optional, Any
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
 from .gie_raw_client import GieRawClient
@@ -10,6 +23,7 @@ from .mappings.agsi_facility import AGSIFacility
 from .mappings.alsi_company import ALSICompany
 from .mappings.alsi_country import ALSICountry
 from .mappings.alsi_facility import ALSIFacility
+from .profiling import QueryProfile, activate, profile_stage
 
 
 class GiePandasClient(GieRawClient):
@@ -27,19 +41,106 @@ class GiePandasClient(GieRawClient):
         "withdrawalCapacity",
         "trend",
         "full",
-        "inventory",
+        "inventory_lng",
+        "inventory_gwh",
         "sendOut",
-        "dtmi",
+        "dtmi_lng",
+        "dtmi_gwh",
         "dtrs",
         "volume",
     ]
 
+    # ALSI columns holding {"lng": ..., "gwh": ...} objects, expanded
+    # into one column per key, e.g. inventory_lng and inventory_gwh
+    _NESTED_COLS = ["inventory", "dtmi"]
+
+    _DATE_COLS = ["gas_day", "gasDayStart", "gasDayEnd", "updatedAt"]
+
+    _CATEGORY_COLS = [
+        "code",
+        "name",
+        "status",
+        "entity_code",
+        "parent_code",
+        "country",
+    ]
+
+    def __init__(
+        self,
+        *args: Any,
+        float_dtype: str = "float64",
+        flatten_children: bool = False,
+        **kwargs
+    ):
+        """Constructor method for our client
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The parameters of `GieRawClient`
+        float_dtype : str, optional
+            dtype of the floating columns, "float32" halves their memory, by default "float64"
+        flatten_children : bool, optional
+            Return the companies and facilities nested under `children` as rows of their own,
+            with `level`, `parent_code` and `country` columns, by default False
+        """
+        super().__init__(*args, **kwargs)
+        self.float_dtype = float_dtype
+        self.flatten_children = flatten_children
+
+    @contextlib.contextmanager
+    def profile(
+        self,
+        collector: Optional[Callable[[QueryProfile], Any]] = None,
+        trace_allocations: bool = False,
+    ) -> Iterator[QueryProfile]:
+        """Profiles the queries run inside the block, stage by stage:
+        network wait, body read, JSON decode, DataFrame construction,
+        `gas_day` insertion and float conversion.
+
+        Usage::
+
+            with client.profile() as profile:
+                frame = await client.query_country_agsi_storage("DE")
+            print(profile.as_dict())
+
+        Parameters
+        ----------
+        collector : Optional[Callable[[QueryProfile], Any]], optional
+            Function called with the profile when the block is left, by default None
+        trace_allocations : bool, optional
+            Also measure the allocations of the stages with tracemalloc, which slows
+            them down, by default False
+
+        Yields
+        ------
+        QueryProfile
+            The profile, complete once the block is left
+        """
+        with activate(QueryProfile(), trace_allocations) as query_profile:
+            yield query_profile
+
+        if collector is not None:
+            collector(query_profile)
+
     def _pandas_df_format(
         self, json_res: Dict[str, Any], float_cols: Optional[list] = None
     ) -> pd.DataFrame:
         """Abstract method which transformes json
            data to a pandas DataFrame
 
+        The records are transposed into one list per column and every
+        typed column is converted straight from its list, so the frame
+        is built without intermediate copies. Every floating column is
+        converted on its own, so a placeholder such as "-" becomes NaN
+        instead of keeping the column as object; columns holding nested
+        objects are never converted. The nested ALSI objects of
+        `_NESTED_COLS` are expanded into one column per key first, e.g.
+        `inventory_lng` and `inventory_gwh`. Date columns are parsed
+        to datetime64 and identifier columns are stored as categories.
+        With `flatten_children`, the nested records are flattened first.
+        The stages are measured into the active profile of `profile`.
+
         Parameters
         ----------
         json_res : Dict[str, Any]
@@ -52,48 +153,241 @@ class GiePandasClient(GieRawClient):
         pd.DataFrame
             DataFrame holding the queried data
         """
-        df = (
-            pd.DataFrame(json_res["data"])
-            if "data" in json_res
-            else pd.DataFrame(json_res)
-        )
+        records = json_res["data"] if "data" in json_res else json_res
+        if not isinstance(records, list) or not all(
+            isinstance(record, dict) for record in records
+        ):
+            with profile_stage("dataframe_construction"):
+                return pd.DataFrame(records)
+
+        with profile_stage("dataframe_construction"):
+            if self.flatten_children and any(
+                "children" in record for record in records
+            ):
+                records = self._flatten_children(records)
+
+            columns: Dict[str, Any] = self._expand_nested(
+                self._columns(records)
+            )
 
         if "gas_day" in json_res:
-            df.insert(0, "gas_day", json_res["gas_day"], allow_duplicates=True)
+            with profile_stage("gas_day_insertion"):
+                gas_day = pd.to_datetime(
+                    [json_res["gas_day"]], errors="coerce"
+                )
+                columns = dict(
+                    {"gas_day": gas_day.repeat(len(records))}, **columns
+                )
+
+        float_set = set(float_cols) if float_cols is not None else set()
+        with profile_stage("float_conversion"):
+            for col in float_set.intersection(columns).difference(["gas_day"]):
+                if any(
+                    isinstance(value, (dict, list)) for value in columns[col]
+                ):
+                    continue  # Coercing nested objects would only give NaN
+                columns[col] = pd.to_numeric(
+                    self._object_array(columns[col]), errors="coerce"
+                ).astype(self.float_dtype, copy=False)
+
+        with profile_stage("dataframe_construction"):
+            for col, values in columns.items():
+                if col == "gas_day" or col in float_set:
+                    continue
+                if col in self._DATE_COLS:
+                    columns[col] = pd.to_datetime(
+                        self._object_array(values), errors="coerce"
+                    )
+                elif col in self._CATEGORY_COLS:
+                    try:
+                        columns[col] = pd.Categorical(
+                            self._object_array(values)
+                        )
+                    except TypeError:
+                        # Unhashable values, e.g. nested objects
+                        pass
 
-        if float_cols is not None:
-            df_cols = [x for x in float_cols if x in df.columns]
-            if df_cols:
-                df[df_cols] = df[df_cols].astype("float", errors="ignore")
+            return pd.DataFrame(columns, copy=False)
 
-        return df
+    @staticmethod
+    def _page_result(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Rebuilds the result of a page from its records, with the gas
+        day of the page when the API returned one."""
+        gas_day = getattr(records, "gas_day", None)
+        if gas_day is None:
+            return {"data": records}
+        return {"gas_day": gas_day, "data": records}
 
-    async def query_agsi_eic_listing(self) -> pd.DataFrame:
+    @classmethod
+    def _expand_nested(cls, columns: Dict[str, list]) -> Dict[str, list]:
+        """Replaces every column of `_NESTED_COLS` holding objects with
+        one column per key of the objects, named `<column>_<key>`, at
+        the position of the column."""
+        if not any(
+            col in columns
+            and any(isinstance(value, dict) for value in columns[col])
+            for col in cls._NESTED_COLS
+        ):
+            return columns
+
+        expanded: Dict[str, list] = {}
+        for col, values in columns.items():
+            if col not in cls._NESTED_COLS or not any(
+                isinstance(value, dict) for value in values
+            ):
+                expanded[col] = values
+                continue
+
+            keys = dict.fromkeys(
+                key
+                for value in values
+                if isinstance(value, dict)
+                for key in value
+            )
+            for key in keys:
+                expanded["%s_%s" % (col, key)] = [
+                    value.get(key) if isinstance(value, dict) else None
+                    for value in values
+                ]
+        return expanded
+
+    @staticmethod
+    def _object_array(values: list) -> np.ndarray:
+        """Copies a column into an object array, which pandas converts
+        much faster than a list."""
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    @staticmethod
+    def _flatten_children(
+        records: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Flattens the records nested under `children` into a long list
+        of records, every record followed by its descendants.
+
+        The tree is walked once with an explicit stack. Every record is
+        tagged with its `level`, 0 for the queried entities, the
+        `parent_code` of the record it is nested under and the `country`
+        of its top level record. Children inherit the gas day and the
+        `entity_code` of their parent when they do not have their own.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]]
+            The top level records
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The flattened records, without the `children` key
+        """
+        inherited = ("gasDayStart", "gasDayEnd", "entity_code")
+        flat = []
+        stack: List[
+            Tuple[Dict[str, Any], int, Optional[Dict[str, Any]], Any]
+        ] = [(record, 0, None, None) for record in reversed(records)]
+        while stack:
+            record, level, parent, country = stack.pop()
+            row = {
+                key: value
+                for key, value in record.items()
+                if key != "children"
+            }
+            if parent is not None:
+                for key in inherited:
+                    if row.get(key) is None and key in parent:
+                        row[key] = parent[key]
+            if country is None:
+                country = row.get("country")
+                if not isinstance(country, str):
+                    country = row.get("code")
+            row["level"] = level
+            row["parent_code"] = (
+                parent.get("code") if parent is not None else None
+            )
+            row["country"] = country
+            flat.append(row)
+
+            children = record.get("children")
+            if isinstance(children, list):
+                stack.extend(
+                    (child, level + 1, row, country)
+                    for child in reversed(children)
+                    if isinstance(child, dict)
+                )
+
+        return flat
+
+    @staticmethod
+    def _columns(records: List[Dict[str, Any]]) -> Dict[str, list]:
+        """Transposes records into one list of values per column.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]]
+            The records, which may not all have the same keys
+
+        Returns
+        -------
+        Dict[str, list]
+            The values of every column in record order, None where a
+            record does not have the column
+        """
+        keys = list(records[0]) if records else []
+        if all(len(record) == len(keys) for record in records):
+            try:
+                return {
+                    key: [record[key] for record in records] for key in keys
+                }
+            except KeyError:
+                pass
+
+        keys = list(dict.fromkeys(key for record in records for key in record))
+        return {key: [record.get(key) for record in records] for key in keys}
+
+    async def query_agsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> pd.DataFrame:
         """Return all the AGSI EIC (Energy Identification Code) listing
 
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
         Returns
         -------
         pd.DataFrame
             DataFrame holding the queried data
 
         """
-        json_result = await super().query_agsi_eic_listing()
+        json_result = await super().query_agsi_eic_listing(all_pages=all_pages)
         return self._pandas_df_format(json_result)
 
-    async def query_alsi_eic_listing(self) -> pd.DataFrame:
+    async def query_alsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> pd.DataFrame:
         """Return all the ALSI EIC (Energy Identification Code) listing
 
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
         Returns
         -------
         pd.DataFrame
             DataFrame holding the queried data
 
         """
-        json_result = await super().query_alsi_eic_listing()
+        json_result = await super().query_alsi_eic_listing(all_pages=all_pages)
         return self._pandas_df_format(json_result)
 
     async def query_alsi_news_listing(
-        self, news_url_item: Optional[Union[int, str]] = None
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return all the ALSI news or a specific country news listings
 
@@ -101,6 +395,8 @@ class GiePandasClient(GieRawClient):
         ----------
         news_url_item : Optional[Union[int, str]], optional
            An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -108,12 +404,14 @@ class GiePandasClient(GieRawClient):
             DataFrame holding the queried data
         """
         json_result = await super().query_alsi_news_listing(
-            news_url_item=news_url_item
+            news_url_item=news_url_item, all_pages=all_pages
         )
         return self._pandas_df_format(json_result)
 
     async def query_agsi_news_listing(
-        self, news_url_item: Optional[Union[int, str]] = None
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return all the AGSI news or a specific country news listings
 
@@ -121,6 +419,8 @@ class GiePandasClient(GieRawClient):
         ----------
         news_url_item : Optional[Union[int, str]], optional
            An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -128,7 +428,7 @@ class GiePandasClient(GieRawClient):
             DataFrame holding the queried data
         """
         json_result = await super().query_agsi_news_listing(
-            news_url_item=news_url_item
+            news_url_item=news_url_item, all_pages=all_pages
         )
         return self._pandas_df_format(json_result)
 
@@ -139,6 +439,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return listing with the AGSI storage data for a
            specific country or all countries
@@ -155,6 +456,8 @@ class GiePandasClient(GieRawClient):
             Optional current date param, by default None
         size : Optional[Union[int, str]], optional
            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -162,7 +465,12 @@ class GiePandasClient(GieRawClient):
             DataFrame holding queried data
         """
         json_result = await super().query_country_agsi_storage(
-            country=country, start=start, end=end, date=date, size=size
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -173,6 +481,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return listing with the ALSI storage data for
            a specific country or all countries
@@ -189,6 +498,8 @@ class GiePandasClient(GieRawClient):
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -196,7 +507,12 @@ class GiePandasClient(GieRawClient):
             DataFrame holding queried data
         """
         json_result = await super().query_country_alsi_storage(
-            country=country, start=start, end=end, date=date, size=size
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -207,6 +523,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return listing with the AGSI data for a specific facility storage
 
@@ -222,6 +539,8 @@ class GiePandasClient(GieRawClient):
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -234,6 +553,7 @@ class GiePandasClient(GieRawClient):
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -244,6 +564,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Return listing with the ALSI data for a specific facility storage
 
@@ -259,6 +580,8 @@ class GiePandasClient(GieRawClient):
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -271,6 +594,7 @@ class GiePandasClient(GieRawClient):
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -281,6 +605,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Returns listing with the AGSI data for a specific company
 
@@ -296,6 +621,8 @@ class GiePandasClient(GieRawClient):
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -308,6 +635,7 @@ class GiePandasClient(GieRawClient):
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -318,6 +646,7 @@ class GiePandasClient(GieRawClient):
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Returns listing with the ALSI data for a specific company
 
@@ -333,6 +662,8 @@ class GiePandasClient(GieRawClient):
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -345,6 +676,7 @@ class GiePandasClient(GieRawClient):
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -354,6 +686,7 @@ class GiePandasClient(GieRawClient):
         start: Optional[Union[datetime.datetime, str]] = None,
         end: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Returns the total AGSI unavailability data or
            a specific country unavailability
@@ -368,6 +701,8 @@ class GiePandasClient(GieRawClient):
             Optional end date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -375,7 +710,11 @@ class GiePandasClient(GieRawClient):
             DataFrame holding queried data
         """
         json_result = await super().query_agsi_unavailability(
-            country=country, start=start, end=end, size=size
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
 
@@ -385,6 +724,7 @@ class GiePandasClient(GieRawClient):
         start: Optional[Union[datetime.datetime, str]] = None,
         end: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> pd.DataFrame:
         """Returns the total ALSI unavailability data or
            a specific country unavailability
@@ -399,6 +739,8 @@ class GiePandasClient(GieRawClient):
             Optional end date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -406,6 +748,524 @@ class GiePandasClient(GieRawClient):
             DataFrame holding queried data
         """
         json_result = await super().query_alsi_unavailability(
-            country=country, start=start, end=end, size=size
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_country_agsi_storage_many(
+        self,
+        countries: Sequence[Union[AGSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the AGSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[AGSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_country_agsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_country_alsi_storage_many(
+        self,
+        countries: Sequence[Union[ALSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the ALSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[ALSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_country_alsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_agsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[AGSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the AGSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[AGSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_agsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_alsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[ALSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the ALSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[ALSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_alsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_agsi_company_many(
+        self,
+        companies: Sequence[Union[AGSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the AGSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[AGSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_agsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
         )
         return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def query_alsi_company_many(
+        self,
+        companies: Sequence[Union[ALSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pd.DataFrame:
+        """Returns listing with the ALSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[ALSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame holding queried data with an `entity_code` column
+        """
+        json_result = await super().query_alsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._pandas_df_format(json_result, self._FLOATING_COLS)
+
+    async def iter_country_agsi_storage(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the AGSI storage data for
+           a specific country or all countries,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_country_agsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
+
+    async def iter_country_alsi_storage(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the ALSI storage data for
+           a specific country or all countries,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_country_alsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
+
+    async def iter_agsi_facility_storage(
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the AGSI data for
+           a specific facility storage,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_agsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
+
+    async def iter_alsi_facility_storage(
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the ALSI data for
+           a specific facility storage,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_alsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
+
+    async def iter_agsi_unavailability(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the total AGSI unavailability
+           data or a specific country unavailability,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_agsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
+
+    async def iter_alsi_unavailability(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Iterates over the pages of the total ALSI unavailability
+           data or a specific country unavailability,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pd.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for records in super().iter_alsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._pandas_df_format(
+                self._page_result(records), self._FLOATING_COLS
+            )
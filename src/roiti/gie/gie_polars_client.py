@@ -0,0 +1,1001 @@
+"""AGSI/ALSI client returning Polars frames"""
+
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+    Sequence,
+    Union,
+)
+
+try:
+    import polars as pl
+except ImportError as error:
+    raise ImportError(
+        "GiePolarsClient requires polars and Python 3.8+, "
+        "install it with `pip install roiti-gie[polars]`"
+    ) from error
+
+import pyarrow as pa
+
+from .gie_arrow_client import GieArrowClient
+from .mappings.agsi_company import AGSICompany
+from .mappings.agsi_country import AGSICountry
+from .mappings.agsi_facility import AGSIFacility
+from .mappings.alsi_company import ALSICompany
+from .mappings.alsi_country import ALSICountry
+from .mappings.alsi_facility import ALSIFacility
+
+Frame = Union[pl.DataFrame, pl.LazyFrame]
+
+
+class GiePolarsClient(GieArrowClient):
+    """AGSI/ALSI Polars Client which queries the API and returns data
+
+    The frames are built from the Arrow tables of `GieArrowClient`,
+    whose columns are typed straight from the decoded JSON, and Polars
+    takes over their buffers without copying them. Results of several
+    pages or entities are returned as a `polars.LazyFrame`.
+    """
+
+    @staticmethod
+    def _polars_frame(table: pa.Table, lazy: bool = False) -> Frame:
+        """Transforms a pyarrow Table to a Polars frame
+
+        Parameters
+        ----------
+        table : pa.Table
+            The table holding the queried data
+        lazy : bool, optional
+            Return a LazyFrame, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame, or LazyFrame if `lazy`, holding the queried data
+        """
+        frame = GiePolarsClient._data_frame(table)
+        return frame.lazy() if lazy else frame
+
+    @staticmethod
+    def _data_frame(data: Union[pa.Table, pa.RecordBatch]) -> pl.DataFrame:
+        """Transforms a pyarrow Table or RecordBatch to a Polars DataFrame
+
+        Raises
+        ------
+        TypeError
+            If Polars does not return a DataFrame
+        """
+        frame = pl.from_arrow(data, rechunk=False)
+        if not isinstance(frame, pl.DataFrame):
+            raise TypeError(
+                "Expected a polars DataFrame, got %s!" % type(frame).__name__
+            )
+        return frame
+
+    # The query and iter methods return frames instead of the dicts and
+    # records of GieRawClient, so they ignore the override check
+    async def query_agsi_eic_listing(  # type: ignore[override]
+        self, all_pages: bool = False
+    ) -> Frame:
+        """Return all the AGSI EIC (Energy Identification Code) listing
+
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding the queried data, a LazyFrame
+            when all_pages is set
+
+        """
+        table = await super().query_agsi_eic_listing(all_pages=all_pages)
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_alsi_eic_listing(  # type: ignore[override]
+        self, all_pages: bool = False
+    ) -> Frame:
+        """Return all the ALSI EIC (Energy Identification Code) listing
+
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding the queried data, a LazyFrame
+            when all_pages is set
+
+        """
+        table = await super().query_alsi_eic_listing(all_pages=all_pages)
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_alsi_news_listing(  # type: ignore[override]
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return all the ALSI news or a specific country news listings
+
+        Parameters
+        ----------
+        news_url_item : Optional[Union[int, str]], optional
+           An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding the queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_alsi_news_listing(
+            news_url_item=news_url_item, all_pages=all_pages
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_agsi_news_listing(  # type: ignore[override]
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return all the AGSI news or a specific country news listings
+
+        Parameters
+        ----------
+        news_url_item : Optional[Union[int, str]], optional
+           An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding the queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_agsi_news_listing(
+            news_url_item=news_url_item, all_pages=all_pages
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_country_agsi_storage(  # type: ignore[override]
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return listing with the AGSI storage data for a
+           specific country or all countries
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional starting date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+            Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+           Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_country_agsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_country_alsi_storage(  # type: ignore[override]
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return listing with the ALSI storage data for
+           a specific country or all countries
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+           Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_country_alsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_agsi_facility_storage(  # type: ignore[override]
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return listing with the AGSI data for a specific facility storage
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_agsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_alsi_facility_storage(  # type: ignore[override]
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Return listing with the ALSI data for a specific facility storage
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_alsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_agsi_company(  # type: ignore[override]
+        self,
+        company_name: Union[AGSICompany, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Returns listing with the AGSI data for a specific company
+
+        Parameters
+        ----------
+        company_name : Union[AGSICompany, str]
+            The name of the company to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_agsi_company(
+            company_name=company_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_alsi_company(  # type: ignore[override]
+        self,
+        company_name: Union[ALSICompany, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Returns listing with the ALSI data for a specific company
+
+        Parameters
+        ----------
+        company_name : Union[ALSICompany, str]
+            The name of the company to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_alsi_company(
+            company_name=company_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_agsi_unavailability(  # type: ignore[override]
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Returns the total AGSI unavailability data or
+           a specific country unavailability
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_agsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_alsi_unavailability(  # type: ignore[override]
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Frame:
+        """Returns the total ALSI unavailability data or
+           a specific country unavailability
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Frame
+            DataFrame holding queried data, a LazyFrame
+            when all_pages is set
+        """
+        table = await super().query_alsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table, lazy=all_pages)
+
+    async def query_country_agsi_storage_many(  # type: ignore[override]
+        self,
+        countries: Sequence[Union[AGSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the AGSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[AGSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_country_agsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def query_country_alsi_storage_many(  # type: ignore[override]
+        self,
+        countries: Sequence[Union[ALSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the ALSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[ALSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_country_alsi_storage_many(
+            countries=countries,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def query_agsi_facility_storage_many(  # type: ignore[override]
+        self,
+        facilities: Sequence[Union[AGSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the AGSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[AGSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_agsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def query_alsi_facility_storage_many(  # type: ignore[override]
+        self,
+        facilities: Sequence[Union[ALSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the ALSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[ALSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_alsi_facility_storage_many(
+            facilities=facilities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def query_agsi_company_many(  # type: ignore[override]
+        self,
+        companies: Sequence[Union[AGSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the AGSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[AGSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_agsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def query_alsi_company_many(  # type: ignore[override]
+        self,
+        companies: Sequence[Union[ALSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> pl.LazyFrame:
+        """Returns listing with the ALSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[ALSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame holding queried data with an `entity_code` column
+        """
+        table = await super().query_alsi_company_many(
+            companies=companies,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+        return self._polars_frame(table).lazy()
+
+    async def iter_country_agsi_storage(  # type: ignore[override]
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the AGSI storage data for
+           a specific country or all countries,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_country_agsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
+
+    async def iter_country_alsi_storage(  # type: ignore[override]
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the ALSI storage data for
+           a specific country or all countries,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_country_alsi_storage(
+            country=country,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
+
+    async def iter_agsi_facility_storage(  # type: ignore[override]
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the AGSI data for
+           a specific facility storage,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_agsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
+
+    async def iter_alsi_facility_storage(  # type: ignore[override]
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the ALSI data for
+           a specific facility storage,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_alsi_facility_storage(
+            facility_name=facility_name,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
+
+    async def iter_agsi_unavailability(  # type: ignore[override]
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the total AGSI unavailability
+           data or a specific country unavailability,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_agsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
+
+    async def iter_alsi_unavailability(  # type: ignore[override]
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[pl.DataFrame]:
+        """Iterates over the pages of the total ALSI unavailability
+           data or a specific country unavailability,
+           yielding a DataFrame for each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        pl.DataFrame
+            DataFrame holding the records of each page
+        """
+        async for batch in super().iter_alsi_unavailability(
+            country=country,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield self._data_frame(batch)
@@ -1,10 +1,30 @@
+import asyncio
+import collections
 import datetime
+import functools
 import logging
+import math
+import time
 import urllib.parse
-from typing import Any, Dict, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 
+from .cache import CacheBackend, CachePolicy, MemoryCache, cache_key
+from .connection import accept_encoding, create_connector
+from .decoders import JsonLoads, default_json_loads
 from .exceptions import ApiError
 from .lookup_functions import (
     lookup_agsi_company,
@@ -13,6 +33,7 @@ from .lookup_functions import (
     lookup_country_alsi,
     lookup_facility_agsi,
     lookup_facility_alsi,
+    lookup_many,
 )
 from .mappings.agsi_company import AGSICompany
 from .mappings.agsi_country import AGSICountry
@@ -21,18 +42,74 @@ from .mappings.alsi_company import ALSICompany
 from .mappings.alsi_country import ALSICountry
 from .mappings.alsi_facility import ALSIFacility
 from .mappings.api_mappings import APIType
+from .metrics import MetricsHook, RequestMetrics, create_trace_config
+from .profiling import QueryProfile, current_profile
+from .rate_limiter import RateLimiter, parse_retry_after
+from .retry_policy import RetryPolicy
+from .transport import Transport
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+
+async def _gather(*aws: Awaitable[Any]) -> List[Any]:
+    """Like `asyncio.gather`, but cancels the awaitables which are still
+    running as soon as one of them fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class _SharedRequest:
+    """A request to the API shared by the identical requests sent while
+    it is running"""
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class PageRecords(list):
+    """The records of a result page, yielded by the iter_* methods, with
+    the gas day of the page in `gas_day`, None when the API returned no
+    gas day"""
+
+    def __init__(
+        self, records: List[Dict[str, Any]], gas_day: Optional[str] = None
+    ):
+        super().__init__(records)
+        self.gas_day = gas_day
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "PageRecords":
+        return cls(result.get("data", []), result.get("gas_day"))
 
 
 class GieRawClient:
     """AGSI/ALSI Raw Client which queries the API and returns data"""
 
     def __init__(
-        self, api_key: str, session: Optional[aiohttp.ClientSession] = None
+        self,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrency: int = 10,
+        window_days: Optional[int] = 365,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        timeout: Optional[Union[float, aiohttp.ClientTimeout]] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        json_loads: Optional[JsonLoads] = None,
+        transport: Optional[Transport] = None,
+        metrics_hook: Optional[MetricsHook] = None,
     ):
         """Constructor method for our client
         Parameters
@@ -41,16 +118,99 @@ class GieRawClient:
             The key needed for accessing the API
         session : Optional[aiohttp.ClientSession], optional
             User supplied aiohttp ClientSession, or create a new one if None, by default None
+        max_concurrency : int, optional
+            Maximum number of requests of the client in flight at once, by default 10
+        window_days : Optional[int], optional
+            Length of the date windows a long start/end span is split into, or None to never split, by default 365
+        requests_per_second : Optional[float], optional
+            Client side limit of the request rate, or None for no limit, by default None
+        burst : int, optional
+            Number of requests which may be sent at once under the rate limit, by default 1
+        retry_policy : Optional[RetryPolicy], optional
+            Policy for retrying failed requests, or the default RetryPolicy if None, by default None
+        connector : Optional[aiohttp.BaseConnector], optional
+            Connection pool shared with other clients, e.g. from `connection.create_connector`, which
+            is left open when the session is closed, or create a new one if None, by default None
+        connection_limit : int, optional
+            Maximum number of open connections of a new connection pool, by default 100
+        connection_limit_per_host : int, optional
+            Maximum number of open connections per host of a new connection pool, 0 for no limit, by default 0
+        keepalive_timeout : float, optional
+            Seconds an idle connection of a new connection pool is kept open, by default 30.0
+        dns_cache_ttl : Optional[int], optional
+            Seconds a DNS lookup of a new connection pool is cached, by default 300
+        timeout : Optional[Union[float, aiohttp.ClientTimeout]], optional
+            Total timeout in seconds or detailed timeouts of every request, or aiohttp's default if None, by default None
+        cache : Optional[CacheBackend], optional
+            Persistent cache of the responses, e.g. `cache.FileCache` or `cache.SQLiteCache`,
+            or no caching if None, by default None
+        cache_policy : Optional[CachePolicy], optional
+            Policy deciding for how long the responses are cached, or the default CachePolicy
+            if None, by default None
+        memory_cache : Optional[MemoryCache], optional
+            In-process LRU cache in front of `cache`, or no memory caching if None, by default None
+        json_loads : Optional[JsonLoads], optional
+            Function decoding the raw response bytes, or the fastest installed decoder
+            (orjson, msgspec or json) if None, by default None
+        transport : Optional[Transport], optional
+            Transport sending the requests through the session, e.g. `transport.CassetteTransport`
+            to record or replay the responses, or the plain Transport if None, by default None
+        metrics_hook : Optional[MetricsHook], optional
+            Function called with the `metrics.RequestMetrics` of every request once it is done,
+            e.g. a `metrics.MetricsCollector`, or no metrics if None, by default None
+
+        The connection and timeout options only apply when no session is supplied.
         """
         self._logger = logging.getLogger(self.__class__.__name__)
         self.api_key = api_key
-        self.session = (
-            session
-            if session is not None
-            else aiohttp.ClientSession(
-                raise_for_status=True, headers={"x-key": self.api_key}
-            )
+        self.max_concurrency = max_concurrency
+        self.window_days = window_days
+        self.rate_limiter = RateLimiter(requests_per_second, burst)
+        self.retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.cache = cache
+        self.cache_policy = (
+            cache_policy if cache_policy is not None else CachePolicy()
         )
+        self.memory_cache = memory_cache
+        self.json_loads = (
+            json_loads if json_loads is not None else default_json_loads()
+        )
+        self.transport = transport if transport is not None else Transport()
+        self.metrics_hook = metrics_hook
+        self._in_flight: Dict[str, _SharedRequest] = {}
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        if session is None:
+            connector_owner = connector is None
+            if connector is None:
+                connector = create_connector(
+                    limit=connection_limit,
+                    limit_per_host=connection_limit_per_host,
+                    keepalive_timeout=keepalive_timeout,
+                    ttl_dns_cache=dns_cache_ttl,
+                )
+            if timeout is None:
+                timeout = aiohttp.client.DEFAULT_TIMEOUT
+            elif not isinstance(timeout, aiohttp.ClientTimeout):
+                timeout = aiohttp.ClientTimeout(total=timeout)
+
+            session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=connector_owner,
+                raise_for_status=True,
+                headers={
+                    "x-key": self.api_key,
+                    aiohttp.hdrs.ACCEPT_ENCODING: accept_encoding(),
+                },
+                timeout=timeout,
+                trace_configs=(
+                    [create_trace_config()]
+                    if metrics_hook is not None
+                    else None
+                ),
+            )
+        self.session = session
 
     @property
     def api_key(self):
@@ -62,9 +222,37 @@ class GieRawClient:
             raise ApiError("API key is missing!")
         self.__api_key = value
 
-    async def query_agsi_eic_listing(self) -> Dict[str, Any]:
+    @property
+    def max_concurrency(self):
+        return self.__max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        if value < 1:
+            raise ValueError("max_concurrency must be a positive integer!")
+        self.__max_concurrency = value
+        self._request_slots = None
+
+    @property
+    def window_days(self):
+        return self.__window_days
+
+    @window_days.setter
+    def window_days(self, value):
+        if value is not None and value < 1:
+            raise ValueError("window_days must be a positive integer!")
+        self.__window_days = value
+
+    async def query_agsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> Dict[str, Any]:
         """Return all the AGSI EIC (Energy Identification Code) listing.
 
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
         Returns
         -------
         Dict[str, Any]
@@ -72,21 +260,34 @@ class GieRawClient:
 
         """
         self._logger.info("Query AGSI EIC listing started awaiting result..")
-        return await self.fetch(APIType.AGSI, "about?show=listing")
+        return await self.fetch(
+            APIType.AGSI, "about?show=listing", all_pages=all_pages
+        )
 
-    async def query_alsi_eic_listing(self) -> Dict[str, Any]:
+    async def query_alsi_eic_listing(
+        self, all_pages: bool = False
+    ) -> Dict[str, Any]:
         """Return all the AGSI EIC (Energy Identification Code) listing.
 
+        Parameters
+        ----------
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
         Returns
         -------
         Dict[str, Any]
             Object holding the data
         """
         self._logger.info("Query ALSI EIC listing started awaiting result..")
-        return await self.fetch(APIType.ALSI, "about?show=listing")
+        return await self.fetch(
+            APIType.ALSI, "about?show=listing", all_pages=all_pages
+        )
 
     async def query_alsi_news_listing(
-        self, news_url_item: Optional[Union[int, str]] = None
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return all the ALSI news or a specific country news listings
 
@@ -94,6 +295,8 @@ class GieRawClient:
         ----------
         news_url_item : Optional[Union[int, str]], optional
            An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -102,11 +305,16 @@ class GieRawClient:
         """
         self._logger.info("Query ALSI NEWS listing started awaiting result..")
         return await self.fetch(
-            APIType.ALSI, "news", news_url_item=news_url_item
+            APIType.ALSI,
+            "news",
+            news_url_item=news_url_item,
+            all_pages=all_pages,
         )
 
     async def query_agsi_news_listing(
-        self, news_url_item: Optional[Union[int, str]] = None
+        self,
+        news_url_item: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return all the AGSI news or a specific country news listings
 
@@ -114,6 +322,8 @@ class GieRawClient:
         ----------
         news_url_item : Optional[Union[int, str]], optional
            An integer representing a specific country, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -122,7 +332,10 @@ class GieRawClient:
         """
         self._logger.info("Query AGSI NEWS listing started awaiting result..")
         return await self.fetch(
-            APIType.AGSI, "news", news_url_item=news_url_item
+            APIType.AGSI,
+            "news",
+            news_url_item=news_url_item,
+            all_pages=all_pages,
         )
 
     async def query_country_agsi_storage(
@@ -132,6 +345,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return listing with the AGSI storage data for
            a specific country or all countries
@@ -148,6 +362,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -167,6 +383,7 @@ class GieRawClient:
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_country_alsi_storage(
@@ -176,6 +393,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return listing with the ALSI storage data for
            a specific country or all countries
@@ -192,6 +410,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -205,12 +425,13 @@ class GieRawClient:
 
         self._logger.info("Query ALSI COUNTRY STORAGE started..")
         return await self.fetch(
-            APIType.AGSI,
+            APIType.ALSI,
             params=params,
             start=start,
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_agsi_unavailability(
@@ -219,6 +440,7 @@ class GieRawClient:
         start: Optional[Union[datetime.datetime, str]] = None,
         end: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Returns the total AGSI unavailability data or
            a specific country unavailability
@@ -233,6 +455,8 @@ class GieRawClient:
             Optional end date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -252,6 +476,7 @@ class GieRawClient:
             start=start,
             end=end,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_alsi_unavailability(
@@ -260,6 +485,7 @@ class GieRawClient:
         start: Optional[Union[datetime.datetime, str]] = None,
         end: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Returns the total ALSI unavailability data or
            a specific country unavailability
@@ -274,6 +500,8 @@ class GieRawClient:
             Optional end date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -293,6 +521,7 @@ class GieRawClient:
             start=start,
             end=end,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_agsi_facility_storage(
@@ -302,6 +531,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return listing with the AGSI data for a specific facility storage
 
@@ -317,6 +547,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -335,6 +567,7 @@ class GieRawClient:
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_alsi_facility_storage(
@@ -344,6 +577,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Return listing with the ALSI data for a specific facility storage
 
@@ -359,6 +593,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -376,6 +612,7 @@ class GieRawClient:
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_agsi_company(
@@ -385,6 +622,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Returns listing with the AGSI data for a specific company
 
@@ -400,6 +638,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -417,6 +657,7 @@ class GieRawClient:
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
     async def query_alsi_company(
@@ -426,6 +667,7 @@ class GieRawClient:
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
     ) -> Dict[str, Any]:
         """Returns listing with the ALSI data for a specific company
 
@@ -441,6 +683,8 @@ class GieRawClient:
            Optional current date param, by default None
         size : Optional[Union[int, str]], optional
             Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
@@ -458,62 +702,1267 @@ class GieRawClient:
             end=end,
             date=date,
             size=size,
+            all_pages=all_pages,
         )
 
-    async def fetch(
+    async def query_country_agsi_storage_many(
         self,
-        api_type: Union[APIType, str],
-        endpoint: Optional[str] = None,
-        params: Optional[Dict[str, str]] = None,
-        news_url_item: Optional[Union[int, str]] = None,
+        countries: Sequence[Union[AGSICountry, str]],
         start: Optional[Union[datetime.datetime, str]] = None,
         end: Optional[Union[datetime.datetime, str]] = None,
         date: Optional[Union[datetime.datetime, str]] = None,
         size: Optional[Union[int, str]] = None,
-    ):
-        """Builds the URL and sends requests to the API.
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the AGSI data for several countries
+           queried concurrently
 
         Parameters
         ----------
-            api_type: Union[APIType, str],
-            endpoint: Optional[str] = None,
-            params: Optional[Dict[str, Any][str, str]] = None,
-            news_url_item: Optional[Union[int, str]] = None,
-            start: Optional[Union[datetime.datetime, str]] = None,
-            end: Optional[Union[datetime.datetime, str]] = None,
-            date: Optional[Union[datetime.datetime, str]] = None,
-            size: Optional[Union[int, str]] = None,
+        countries : Sequence[Union[AGSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
 
         Returns
         -------
-            Returns the desired data according to the pointed params.
+        Dict[str, Any]
+            Object holding the queried data of all the countries,
+            each record tagged with its `entity_code`
         """
-        _params = {
-            "url": news_url_item,
-            "from": start,
-            "to": end,
-            "date": date,
-            "size": size,
-        }
+        entities = lookup_many(countries, AGSICountry)
 
-        if params is not None:
-            _params.update(params)
+        self._logger.info(
+            "Query AGSI COUNTRY STORAGE for %s countries started..",
+            len(entities),
+        )
+        return await self._fetch_many(
+            APIType.AGSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
 
-        root_url = (
-            api_type.value if isinstance(api_type, APIType) else api_type
+    async def query_country_alsi_storage_many(
+        self,
+        countries: Sequence[Union[ALSICountry, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the ALSI data for several countries
+           queried concurrently
+
+        Parameters
+        ----------
+        countries : Sequence[Union[ALSICountry, str]]
+            The countries to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the queried data of all the countries,
+            each record tagged with its `entity_code`
+        """
+        entities = lookup_many(countries, ALSICountry)
+
+        self._logger.info(
+            "Query ALSI COUNTRY STORAGE for %s countries started..",
+            len(entities),
+        )
+        return await self._fetch_many(
+            APIType.ALSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
         )
 
-        final_url = urllib.parse.urljoin(root_url, endpoint)
-        final_params = {k: v for k, v in _params.items() if v is not None}
+    async def query_agsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[AGSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the AGSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[AGSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the queried data of all the facilities,
+            each record tagged with its `entity_code`
+        """
+        entities = lookup_many(facilities, AGSIFacility)
+
+        self._logger.info(
+            "Query AGSI FACILITY STORAGE for %s facilities started..",
+            len(entities),
+        )
+        return await self._fetch_many(
+            APIType.AGSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+
+    async def query_alsi_facility_storage_many(
+        self,
+        facilities: Sequence[Union[ALSIFacility, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the ALSI data for several facilities
+           queried concurrently
+
+        Parameters
+        ----------
+        facilities : Sequence[Union[ALSIFacility, str]]
+            The facilities to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the queried data of all the facilities,
+            each record tagged with its `entity_code`
+        """
+        entities = lookup_many(facilities, ALSIFacility)
+
+        self._logger.info(
+            "Query ALSI FACILITY STORAGE for %s facilities started..",
+            len(entities),
+        )
+        return await self._fetch_many(
+            APIType.ALSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+
+    async def query_agsi_company_many(
+        self,
+        companies: Sequence[Union[AGSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the AGSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[AGSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the queried data of all the companies,
+            each record tagged with its `entity_code`
+        """
+        entities = lookup_many(companies, AGSICompany)
+
+        self._logger.info(
+            "Query AGSI COMPANY for %s companies started..", len(entities)
+        )
+        return await self._fetch_many(
+            APIType.AGSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+
+    async def query_alsi_company_many(
+        self,
+        companies: Sequence[Union[ALSICompany, str]],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ) -> Dict[str, Any]:
+        """Returns listing with the ALSI data for several companies
+           queried concurrently
+
+        Parameters
+        ----------
+        companies : Sequence[Union[ALSICompany, str]]
+            The companies to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        all_pages : bool, optional
+            Fetch every result page and merge them, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the queried data of all the companies,
+            each record tagged with its `entity_code`
+        """
+        entities = lookup_many(companies, ALSICompany)
+
+        self._logger.info(
+            "Query ALSI COMPANY for %s companies started..", len(entities)
+        )
+        return await self._fetch_many(
+            APIType.ALSI,
+            entities,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            all_pages=all_pages,
+        )
+
+    async def iter_country_agsi_storage(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the AGSI storage data for
+           a specific country or all countries,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        params = None
+        if country is not None:
+            country_param = lookup_country_agsi(country)
+            params = country_param.get_params()
+
+        self._logger.info("Iterate AGSI COUNTRY STORAGE started..")
+        async for records in self.iter_pages(
+            APIType.AGSI,
+            params=params,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def iter_country_alsi_storage(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the ALSI storage data for
+           a specific country or all countries,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        params = None
+        if country is not None:
+            country_param = lookup_country_alsi(country)
+            params = country_param.get_params()
+
+        self._logger.info("Iterate ALSI COUNTRY STORAGE started..")
+        async for records in self.iter_pages(
+            APIType.ALSI,
+            params=params,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def iter_agsi_unavailability(
+        self,
+        country: Optional[Union[AGSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the total AGSI unavailability
+           data or a specific country unavailability,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        country : Optional[Union[AGSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        params = None
+        if country is not None:
+            country_param = lookup_country_agsi(country)
+            params = country_param.get_params()
+
+        self._logger.info("Iterate AGSI UNAVAILABILITY started..")
+        async for records in self.iter_pages(
+            APIType.AGSI,
+            endpoint="unavailability",
+            params=params,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def iter_alsi_unavailability(
+        self,
+        country: Optional[Union[ALSICountry, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the total ALSI unavailability
+           data or a specific country unavailability,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        country : Optional[Union[ALSICountry, str]], optional
+            Optional country param, by default None
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        params = None
+        if country is not None:
+            country_param = lookup_country_alsi(country)
+            params = country_param.get_params()
+
+        self._logger.info("Iterate ALSI UNAVAILABILITY started..")
+        async for records in self.iter_pages(
+            APIType.ALSI,
+            endpoint="unavailability",
+            params=params,
+            start=start,
+            end=end,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def iter_agsi_facility_storage(
+        self,
+        facility_name: Union[AGSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the AGSI data for
+           a specific facility storage,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        facility_name : Union[AGSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        facility_param = lookup_facility_agsi(facility_name)
+        params = facility_param.get_params()
+
+        self._logger.info("Iterate AGSI FACILITY STORAGE started..")
+        async for records in self.iter_pages(
+            APIType.AGSI,
+            params=params,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def iter_alsi_facility_storage(
+        self,
+        facility_name: Union[ALSIFacility, str],
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of the ALSI data for
+           a specific facility storage,
+           yielding the records of each page
+
+        Parameters
+        ----------
+        facility_name : Union[ALSIFacility, str]
+            The name of the facility to query for
+        start : Optional[Union[datetime.datetime, str]], optional
+            Optional start date param, by default None
+        end : Optional[Union[datetime.datetime, str]], optional
+            Optional end date param, by default None
+        date : Optional[Union[datetime.datetime, str]], optional
+           Optional current date param, by default None
+        size : Optional[Union[int, str]], optional
+            Optional result size param, by default None
+        prefetch : int, optional
+            Number of pages requested ahead of the consumer, by default 2
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The records of each page
+        """
+        facility_param = lookup_facility_alsi(facility_name)
+        params = facility_param.get_params()
+
+        self._logger.info("Iterate ALSI FACILITY STORAGE started..")
+        async for records in self.iter_pages(
+            APIType.ALSI,
+            params=params,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+            prefetch=prefetch,
+        ):
+            yield records
+
+    async def fetch(
+        self,
+        api_type: Union[APIType, str],
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, str]] = None,
+        news_url_item: Optional[Union[int, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        all_pages: bool = False,
+    ):
+        """Builds the URL and sends requests to the API.
+
+        When `all_pages` is set, the first page is used to find out how
+        many pages the result has, the remaining pages are requested
+        concurrently and their `data` arrays are merged into the first
+        page in page order. At most `max_concurrency` requests of the
+        client are in flight at once.
+        Storage requests with `all_pages` whose `start`/`end` span is
+        longer than `window_days` are also split into date windows which
+        are fetched concurrently and stitched back together. Without
+        `all_pages` a single request is sent, which returns the first
+        page of the whole span.
+
+        Parameters
+        ----------
+            api_type: Union[APIType, str],
+            endpoint: Optional[str] = None,
+            params: Optional[Dict[str, Any][str, str]] = None,
+            news_url_item: Optional[Union[int, str]] = None,
+            start: Optional[Union[datetime.datetime, str]] = None,
+            end: Optional[Union[datetime.datetime, str]] = None,
+            date: Optional[Union[datetime.datetime, str]] = None,
+            size: Optional[Union[int, str]] = None,
+            all_pages: bool = False,
+
+        Returns
+        -------
+            Returns the desired data according to the pointed params.
+        """
+        final_url, final_params = self._build_request(
+            api_type,
+            endpoint=endpoint,
+            params=params,
+            news_url_item=news_url_item,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+        )
+
+        if not all_pages:
+            return await self._get(final_url, final_params)
+
+        windows = self._date_windows(start, end) if endpoint is None else []
+        if len(windows) <= 1:
+            return await self._fetch_all_pages(final_url, final_params)
+
+        self._logger.info("fetching %s date windows..", len(windows))
+        results = await _gather(
+            *(
+                self._fetch_all_pages(
+                    final_url,
+                    dict(
+                        final_params,
+                        **{
+                            "from": window_start.isoformat(),
+                            "to": window_end.isoformat(),
+                        },
+                    ),
+                )
+                for window_start, window_end in windows
+            )
+        )
+
+        return self._merge_windows(results)
+
+    async def _fetch_many(
+        self,
+        api_type: Union[APIType, str],
+        entities: Sequence[Any],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Fetches the same query for several entities concurrently,
+        with at most `max_concurrency` requests in flight at once.
+
+        Parameters
+        ----------
+        api_type : Union[APIType, str]
+            The API to query
+        entities : Sequence[Any]
+            Looked up mapping enums providing `code` and `get_params`
+        **kwargs : Any
+            Params passed on to `fetch`
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the records of all the entities in the
+            given order, each tagged with its `entity_code`
+        """
+        results = await _gather(
+            *(
+                self.fetch(api_type, params=entity.get_params(), **kwargs)
+                for entity in entities
+            )
+        )
+
+        data: List[Dict[str, Any]] = []
+        for entity, result in zip(entities, results):
+            data.extend(
+                dict(record, entity_code=entity.code)
+                for record in result.get("data", [])
+            )
+
+        return {"total": len(data), "data": data}
+
+    async def _fetch_all_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+    ) -> Any:
+        """Fetches the first page of a result, then the remaining pages
+        concurrently, and merges their `data` arrays in page order.
+
+        Parameters
+        ----------
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+
+        Returns
+        -------
+        Any
+            A copy of the first page holding the data of all the pages
+        """
+        result = await self._get(url, params)
+
+        last_page = self._last_page(result)
+        if last_page <= 1:
+            return result
+
+        self._logger.info("fetching %s more pages..", last_page - 1)
+
+        pages = await _gather(
+            *(
+                self._get(url, dict(params, page=page))
+                for page in range(2, last_page + 1)
+            )
+        )
+
+        data = list(result.get("data", []))
+        for page_result in pages:
+            data.extend(page_result.get("data", []))
+
+        return dict(result, data=data, last_page=1)
+
+    def _date_windows(
+        self,
+        start: Optional[Union[datetime.datetime, str]],
+        end: Optional[Union[datetime.datetime, str]],
+    ) -> List[Tuple[datetime.date, datetime.date]]:
+        """Splits the `start`/`end` span into consecutive windows of at
+        most `window_days` gas days, newest window first.
+
+        Parameters
+        ----------
+        start : Optional[Union[datetime.datetime, str]]
+            The start date of the span
+        end : Optional[Union[datetime.datetime, str]]
+            The end date of the span
+
+        Returns
+        -------
+        List[Tuple[datetime.date, datetime.date]]
+            The inclusive (start, end) windows, empty if the span
+            can not be split
+        """
+        if self.window_days is None:
+            return []
+
+        start_day = self._to_date(start)
+        end_day = self._to_date(end)
+        if start_day is None or end_day is None or start_day > end_day:
+            return []
+
+        step = datetime.timedelta(days=self.window_days - 1)
+        windows = []
+        window_end = end_day
+        while window_end >= start_day:
+            window_start = max(window_end - step, start_day)
+            windows.append((window_start, window_end))
+            window_end = window_start - datetime.timedelta(days=1)
+
+        return windows
+
+    @staticmethod
+    def _to_date(
+        value: Optional[Union[datetime.datetime, str]],
+    ) -> Optional[datetime.date]:
+        """Converts a date param to a date, None if it is not a date."""
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        if isinstance(value, str):
+            try:
+                return datetime.date.fromisoformat(value[:10])
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def _merge_windows(results: List[Any]) -> Any:
+        """Stitches the results of consecutive date windows together.
+
+        The records are ordered newest gas day first, as the API
+        returns them, and records of the same gas day and code which
+        appear in more than one window are kept once.
+
+        Parameters
+        ----------
+        results : List[Any]
+            The results of the windows, newest window first
+
+        Returns
+        -------
+        Any
+            A copy of the first result holding the data of all the
+            windows, as a single page
+        """
+        seen = set()
+        data = []
+        for result in results:
+            for record in result.get("data", []):
+                key = (record.get("gasDayStart"), record.get("code"))
+                if key[0] is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                data.append(record)
+
+        data.sort(
+            key=lambda record: record.get("gasDayStart") or "", reverse=True
+        )
+        return dict(results[0], data=data, total=len(data), last_page=1)
+
+    async def iter_pages(
+        self,
+        api_type: Union[APIType, str],
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, str]] = None,
+        news_url_item: Optional[Union[int, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over the pages of a result, yielding the records
+        of every page in page order as soon as it is available, as
+        `PageRecords` holding the gas day of the page.
+
+        At most `prefetch` pages are requested ahead of the consumer,
+        so a slow consumer holds back the download instead of piling
+        up pages in memory.
+
+        Parameters
+        ----------
+            api_type: Union[APIType, str],
+            endpoint: Optional[str] = None,
+            params: Optional[Dict[str, Any][str, str]] = None,
+            news_url_item: Optional[Union[int, str]] = None,
+            start: Optional[Union[datetime.datetime, str]] = None,
+            end: Optional[Union[datetime.datetime, str]] = None,
+            date: Optional[Union[datetime.datetime, str]] = None,
+            size: Optional[Union[int, str]] = None,
+            prefetch: int = 2,
+
+        Yields
+        ------
+            The records of each page.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be a positive integer!")
+
+        final_url, final_params = self._build_request(
+            api_type,
+            endpoint=endpoint,
+            params=params,
+            news_url_item=news_url_item,
+            start=start,
+            end=end,
+            date=date,
+            size=size,
+        )
+
+        result = await self._get(final_url, final_params)
+        if not isinstance(result, dict):
+            yield result
+            return
+
+        last_page = self._last_page(result)
+        yield PageRecords.from_result(result)
+        del result
+
+        window = min(prefetch, self.max_concurrency)
+        pending: Deque["asyncio.Future[Any]"] = collections.deque()
+        next_page = 2
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < window:
+                    pending.append(
+                        asyncio.ensure_future(
+                            self._get(
+                                final_url,
+                                dict(final_params, page=next_page),
+                            )
+                        )
+                    )
+                    next_page += 1
+
+                page_result = await pending.popleft()
+                yield PageRecords.from_result(page_result)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _build_request(
+        self,
+        api_type: Union[APIType, str],
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, str]] = None,
+        news_url_item: Optional[Union[int, str]] = None,
+        start: Optional[Union[datetime.datetime, str]] = None,
+        end: Optional[Union[datetime.datetime, str]] = None,
+        date: Optional[Union[datetime.datetime, str]] = None,
+        size: Optional[Union[int, str]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Builds the URL and the query string params of a request.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, Any]]
+            The final URL and the params which are not None
+        """
+        _params = {
+            "url": news_url_item,
+            "from": start,
+            "to": end,
+            "date": date,
+            "size": size,
+        }
+
+        if params is not None:
+            _params.update(params)
+
+        root_url = (
+            api_type.value if isinstance(api_type, APIType) else api_type
+        )
+
+        final_url = urllib.parse.urljoin(root_url, endpoint)
+        final_params = {k: v for k, v in _params.items() if v is not None}
+
+        return final_url, final_params
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> Any:
+        """Returns the decoded JSON body of a single GET request, and
+        passes the metrics of the request to the metrics hook and the
+        active profile.
+
+        Parameters
+        ----------
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+
+        Returns
+        -------
+        Any
+            The decoded JSON body, which must not be modified as it may
+            be shared with other callers
+        """
+        profile = current_profile()
+        if self.metrics_hook is None and profile is None:
+            return await self._get_shared(url, params, None)
+
+        metrics = RequestMetrics(url, params)
+        try:
+            result = await self._get_shared(url, params, metrics)
+        except BaseException as err:
+            metrics.finish(err)
+            self._emit_metrics(metrics, profile)
+            raise
+
+        metrics.finish()
+        self._emit_metrics(metrics, profile)
+        return result
+
+    def _emit_metrics(
+        self, metrics: RequestMetrics, profile: Optional[QueryProfile]
+    ) -> None:
+        if profile is not None:
+            profile.add_request(metrics)
+        if self.metrics_hook is None:
+            return
+        try:
+            self.metrics_hook(metrics)
+        except Exception:
+            self._logger.exception("the metrics hook failed")
+
+    async def _get_shared(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        metrics: Optional[RequestMetrics],
+    ) -> Any:
+        """Returns the decoded JSON body of a single GET request.
+
+        The response is taken from the memory cache, then from the
+        persistent cache, when they hold a fresh copy of it. Identical
+        requests sent while the first one is still running wait for its
+        response instead of hitting the API again. The request runs in
+        its own task, so a cancelled caller does not cancel the other
+        callers, and it is only cancelled once no caller waits for it.
+
+        Parameters
+        ----------
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+        metrics : Optional[RequestMetrics]
+            The metrics of the request, filled in as it goes
+
+        Returns
+        -------
+        Any
+            The decoded JSON body, which must not be modified as it may
+            be shared with other callers
+        """
+        key = cache_key(url, params)
+        if self.memory_cache is not None:
+            result = self.memory_cache.get(key)
+            if result is not None:
+                self._logger.info("fetching the result from memory..")
+                if metrics is not None:
+                    metrics.cache = "memory"
+                return result
+
+        shared = self._in_flight.get(key)
+        if shared is None:
+            task = asyncio.get_running_loop().create_task(
+                self._get_cached(key, url, params, metrics)
+            )
+            shared = self._in_flight[key] = _SharedRequest(task)
+            task.add_done_callback(
+                functools.partial(self._shared_request_done, key, shared)
+            )
+        else:
+            self._logger.info("waiting for the same request in flight..")
+            if metrics is not None:
+                metrics.cache = "coalesced"
+
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                # Nobody waits for the response anymore
+                self._forget_shared_request(key, shared)
+                shared.task.cancel()
+
+    def _forget_shared_request(self, key: str, shared: _SharedRequest) -> None:
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    def _shared_request_done(
+        self, key: str, shared: _SharedRequest, task: "asyncio.Task[Any]"
+    ) -> None:
+        self._forget_shared_request(key, shared)
+        # Retrieved so that a request whose callers are gone logs no warning
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_cached(
+        self,
+        key: str,
+        url: str,
+        params: Dict[str, Any],
+        metrics: Optional[RequestMetrics] = None,
+    ) -> Any:
+        """Returns the decoded JSON body of a single GET request, from
+        the persistent cache when it holds a fresh copy of it, and
+        stores new responses in the caches.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+        metrics : Optional[RequestMetrics], optional
+            The metrics of the request, filled in as it goes, by default None
+
+        Returns
+        -------
+        Any
+            The decoded JSON body
+        """
+        ttl = self.cache_policy.ttl(url, params)
+        cacheable = ttl is None or ttl > 0
+
+        result = (
+            await self._call_cache(self.cache.get, key)
+            if self.cache is not None
+            else None
+        )
+        if result is not None:
+            self._logger.info("fetching the result from the cache..")
+            if metrics is not None:
+                metrics.cache = "persistent"
+        else:
+            result = await self._request(url, params, metrics)
+            if self.cache is not None and cacheable:
+                await self._call_cache(self.cache.set, key, result, ttl)
+
+        if self.memory_cache is not None and cacheable:
+            self.memory_cache.set(key, result, ttl)
+
+        return result
+
+    async def _call_cache(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Calls a method of the persistent cache, in the default executor
+        of the loop when the cache does blocking I/O."""
+        if self.cache is None or not self.cache.blocking:
+            return method(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(method, *args)
+        )
+
+    async def _request(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        metrics: Optional[RequestMetrics] = None,
+    ) -> Any:
+        """Sends a single GET request and decodes the JSON body.
+
+        The request is sent by the client's transport once one of the
+        `max_concurrency` request slots of the client is free, and every
+        request reaching the API waits for the rate limiter. Failed
+        requests are sent again according to the client's retry policy.
+        When the API answers with 429 Too Many Requests, the whole client
+        is paused for the time given by the Retry-After header instead.
+
+        Parameters
+        ----------
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+        metrics : Optional[RequestMetrics], optional
+            The metrics of the request, filled in as it goes, by default None
+
+        Returns
+        -------
+        Any
+            The decoded JSON body
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            If the API answers with an error status which is not
+            retryable or the retry policy gives up
+        """
+        if self._request_slots is None:
+            # Created lazily so that the semaphore belongs to the running loop
+            self._request_slots = asyncio.Semaphore(self.max_concurrency)
+        request_slots = self._request_slots
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if metrics is not None:
+                metrics.attempts = attempt
+            try:
+                async with request_slots:
+                    if self.transport.uses_network:
+                        await self.rate_limiter.acquire()
+                    self._logger.info("fetching the result..")
+                    body = await self.transport.get(
+                        self.session, url, params, metrics
+                    )
+                if metrics is None:
+                    return self.json_loads(body) if body else None
+
+                metrics.response_bytes = len(body)
+                started = time.perf_counter()
+                result = self.json_loads(body) if body else None
+                metrics.decode_time = time.perf_counter() - started
+                return result
+            except Exception as err:
+                if metrics is not None and isinstance(
+                    err, aiohttp.ClientResponseError
+                ):
+                    metrics.status = err.status
+                if (
+                    attempt >= self.retry_policy.max_attempts
+                    or not self.retry_policy.is_retryable(err)
+                    or self.session.closed
+                ):
+                    raise
+
+                if (
+                    isinstance(err, aiohttp.ClientResponseError)
+                    and err.status == 429
+                ):
+                    retry_after = (
+                        err.headers.get(aiohttp.hdrs.RETRY_AFTER)
+                        if err.headers is not None
+                        else None
+                    )
+                    delay = parse_retry_after(
+                        retry_after, self.retry_policy.backoff(attempt)
+                    )
+                    self.rate_limiter.pause(delay)
+                    self._logger.warning(
+                        "rate limited by the API, retrying in %.2fs..", delay
+                    )
+                    continue
+
+                delay = self.retry_policy.backoff(attempt)
+                self._logger.warning(
+                    "request failed (%s), retrying in %.2fs..", err, delay
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _last_page(result: Any) -> int:
+        """Returns the number of pages of a paginated API result.
+
+        Uses `last_page` when the API provides it and falls back to
+        `total` divided by the size of the first page.
+
+        Parameters
+        ----------
+        result : Any
+            The decoded first page of the result
+
+        Returns
+        -------
+        int
+            The number of pages, 1 if the result is not paginated
+        """
+        if not isinstance(result, dict):
+            return 1
+
+        if result.get("last_page"):
+            return int(result["last_page"])
+
+        page_size = len(result.get("data") or [])
+        if result.get("total") and page_size:
+            return math.ceil(int(result["total"]) / page_size)
 
-        async with self.session.get(
-            final_url,
-            params=final_params,
-        ) as resp:
-            self._logger.info("fetching the result..")
-            return await resp.json()
+        return 1
 
     async def close_session(self) -> None:
-        """Close the session."""
+        """Close the session and the transport."""
+        await self.transport.close()
         if self.session:
             await self.session.close()
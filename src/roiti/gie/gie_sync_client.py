@@ -0,0 +1,201 @@
+"""A blocking facade over the asynchronous AGSI/ALSI clients"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+)
+
+from .gie_raw_client import GieRawClient
+
+T = TypeVar("T")
+
+
+class GieSyncClient:
+    """Blocking AGSI/ALSI client for synchronous callers
+
+    An asynchronous client and its session live on an event loop which
+    runs in a background thread for the whole life of the facade, so
+    every call reuses the same connection pool and caches. Every
+    coroutine method of the wrapped client, e.g. the `query_*` methods,
+    `fetch` and `close_session`, blocks until its result is ready and
+    the `iter_*` methods return plain iterators. They take the parameters
+    of the wrapped client's methods and may be called from any number
+    of threads at once; the calls then run concurrently on the loop, in
+    the context of the calling thread, e.g. within its `profile()`.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        client_class: Type[GieRawClient] = GieRawClient,
+        **kwargs: Any
+    ):
+        """Constructor method for the sync client
+
+        Parameters
+        ----------
+        *args, **kwargs
+            The parameters of `client_class`
+        client_class : Type[GieRawClient], optional
+            The asynchronous client to wrap, e.g. GiePandasClient, by default GieRawClient
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="GieSyncClient", daemon=True
+        )
+        self._thread.start()
+
+        async def create_client() -> GieRawClient:
+            # The session has to be created on the loop which uses it
+            return client_class(*args, **kwargs)
+
+        try:
+            self.client = self._run(create_client())
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the background loop and blocks until
+        it is done.
+
+        Raises
+        ------
+        RuntimeError
+            If the client is closed, or when called from a coroutine
+            running on the background loop, which would deadlock.
+        """
+        error = None
+        if self._loop.is_closed():
+            error = RuntimeError("The client is closed!")
+        elif threading.current_thread() is self._thread:
+            error = RuntimeError(
+                "GieSyncClient can not be called from its own event loop!"
+            )
+        if error is not None:
+            coro.close()  # Never awaited, but without a warning
+            raise error
+
+        # The task of the coroutine copies the context it is created in
+        context = contextvars.copy_context()
+        future: "concurrent.futures.Future[T]" = context.run(
+            asyncio.run_coroutine_threadsafe, coro, self._loop
+        )
+        return future.result()
+
+    def _iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Turns an asynchronous iterator into a blocking one, which
+        advances the asynchronous iterator on the background loop."""
+
+        async def next_item() -> T:
+            return await iterator.__anext__()
+
+        async def close() -> None:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        try:
+            while True:
+                try:
+                    yield self._run(next_item())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self._run(close())
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes missing on the facade itself
+        if name == "client":
+            raise AttributeError(name)
+
+        attribute = getattr(self.client, name)
+        if inspect.isasyncgenfunction(attribute):
+            return self._blocking(attribute, self._iterate)
+        if inspect.iscoroutinefunction(attribute):
+            return self._blocking(attribute, self._run)
+        return attribute
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(dir(self.client)))
+
+    @staticmethod
+    def _blocking(
+        method: Callable[..., Any], run: Callable[[Any], Any]
+    ) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def blocking_method(*args: Any, **kwargs: Any) -> Any:
+            return run(method(*args, **kwargs))
+
+        return blocking_method
+
+    def close(self) -> None:
+        """Closes the session of the client and stops the background
+        event loop. Calling it again does nothing."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.client.close_session())
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "GieSyncClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _blocking_method(name: str, method: Callable[..., Any]) -> Any:
+    """Returns a blocking method of the facade calling the method of
+    the wrapped client, which may override it, on the loop."""
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        def blocking_iterator(
+            self: GieSyncClient, *args: Any, **kwargs: Any
+        ) -> Iterator[Any]:
+            return self._iterate(getattr(self.client, name)(*args, **kwargs))
+
+        blocking_iterator.__signature__ = inspect.signature(  # type: ignore
+            method
+        ).replace(return_annotation=Iterator[Any])
+        return blocking_iterator
+
+    @functools.wraps(method)
+    def blocking_method(self: GieSyncClient, *args: Any, **kwargs: Any) -> Any:
+        return self._run(getattr(self.client, name)(*args, **kwargs))
+
+    return blocking_method
+
+
+# The coroutine methods of GieRawClient are defined on the facade too, so
+# that help() and the completion of editors list them with their docs
+for _name, _method in inspect.getmembers(GieRawClient, inspect.isfunction):
+    if not _name.startswith("_") and (
+        inspect.iscoroutinefunction(_method)
+        or inspect.isasyncgenfunction(_method)
+    ):
+        setattr(GieSyncClient, _name, _blocking_method(_name, _method))
@@ -0,0 +1,252 @@
+"""A local SQLite mirror of the AGSI/ALSI storage series"""
+
+import asyncio
+import datetime
+import json
+import logging
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .gie_raw_client import GieRawClient
+from .mappings.agsi_company import AGSICompany
+from .mappings.agsi_country import AGSICountry
+from .mappings.agsi_facility import AGSIFacility
+from .mappings.alsi_company import ALSICompany
+from .mappings.alsi_country import ALSICountry
+from .mappings.alsi_facility import ALSIFacility
+from .mappings.api_mappings import APIType
+
+Entity = Union[
+    AGSICountry,
+    AGSICompany,
+    AGSIFacility,
+    ALSICountry,
+    ALSICompany,
+    ALSIFacility,
+]
+
+_API_TYPES = {
+    AGSICountry: APIType.AGSI,
+    AGSICompany: APIType.AGSI,
+    AGSIFacility: APIType.AGSI,
+    ALSICountry: APIType.ALSI,
+    ALSICompany: APIType.ALSI,
+    ALSIFacility: APIType.ALSI,
+}
+
+
+class GieSyncStore:
+    """Mirrors the storage series of countries, companies and facilities
+    in a SQLite database and only fetches the gas days it is missing"""
+
+    _PAGE_SIZE = 300
+
+    def __init__(
+        self,
+        path: str,
+        client: GieRawClient,
+        entities: Sequence[Entity],
+        initial_start: Union[datetime.date, str] = "2011-01-01",
+        overlap_days: int = 0,
+    ):
+        """Constructor method for the sync store
+
+        Parameters
+        ----------
+        path : str
+            The path of the database file, created if missing
+        client : GieRawClient
+            The client used for querying the API
+        entities : Sequence[Entity]
+            The countries, companies and facilities to mirror, as mapping enum members
+        initial_start : Union[datetime.date, str], optional
+            First gas day fetched for entities which are not stored yet, by default "2011-01-01"
+        overlap_days : int, optional
+            Number of stored gas days fetched again, to pick up revisions of recent data, by default 0
+        """
+        if overlap_days < 0:
+            raise ValueError("overlap_days must not be negative!")
+        for entity in entities:
+            if type(entity) not in _API_TYPES:
+                raise ValueError(
+                    "The entity %r is not a mapping enum member!" % (entity,)
+                )
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.client = client
+        self.entities = list(entities)
+        self.initial_start = (
+            initial_start
+            if isinstance(initial_start, str)
+            else initial_start.isoformat()
+        )
+        self.overlap_days = overlap_days
+
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS storage ("
+                "entity TEXT NOT NULL, "
+                "gas_day TEXT NOT NULL, "
+                "record TEXT NOT NULL, "
+                "PRIMARY KEY (entity, gas_day))"
+            )
+
+    @staticmethod
+    def entity_key(entity: Entity) -> str:
+        """Returns the key the records of an entity are stored under.
+
+        Company codes are not unique across countries, so the key is
+        built from the enum and member names, e.g. "AGSICountry.DE".
+        """
+        return "%s.%s" % (type(entity).__name__, entity.name)
+
+    def last_gas_day(self, entity: Entity) -> Optional[datetime.date]:
+        """Returns the latest stored gas day of an entity.
+
+        Parameters
+        ----------
+        entity : Entity
+            The country, company or facility
+
+        Returns
+        -------
+        Optional[datetime.date]
+            The latest gas day, None if nothing is stored yet
+        """
+        row = self._connection.execute(
+            "SELECT MAX(gas_day) FROM storage WHERE entity = ?",
+            (self.entity_key(entity),),
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return datetime.date.fromisoformat(row[0])
+
+    async def sync(self) -> Dict[str, int]:
+        """Fetches the gas days missing after the latest stored one of
+        every entity concurrently, with at most `client.max_concurrency`
+        requests in flight at once. The entities which are fetched
+        successfully are stored even when others fail.
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of records written per entity key
+
+        Raises
+        ------
+        Exception
+            The first error an entity failed with, once every entity
+            is done
+        """
+        end = datetime.date.today().isoformat()
+
+        results = await asyncio.gather(
+            *(self._sync_entity(entity, end) for entity in self.entities),
+            return_exceptions=True,
+        )
+
+        written = {}
+        errors = []
+        for entity, result in zip(self.entities, results):
+            if isinstance(result, BaseException):
+                self._logger.error(
+                    "syncing %s failed: %s", self.entity_key(entity), result
+                )
+                errors.append(result)
+            else:
+                written[self.entity_key(entity)] = result
+
+        if errors:
+            raise errors[0]
+
+        return written
+
+    async def _sync_entity(self, entity: Entity, end: str) -> int:
+        """Fetches and stores the missing tail of one entity.
+
+        Parameters
+        ----------
+        entity : Entity
+            The country, company or facility
+        end : str
+            The last gas day to fetch
+
+        Returns
+        -------
+        int
+            Number of records written
+        """
+        last_day = self.last_gas_day(entity)
+        if last_day is None:
+            start = self.initial_start
+        else:
+            start_day = last_day + datetime.timedelta(
+                days=1 - self.overlap_days
+            )
+            start = start_day.isoformat()
+            if start > end:
+                return 0
+
+        self._logger.info(
+            "syncing %s from %s..", self.entity_key(entity), start
+        )
+        result = await self.client.fetch(
+            _API_TYPES[type(entity)],
+            params=entity.get_params(),
+            start=start,
+            end=end,
+            size=self._PAGE_SIZE,
+            all_pages=True,
+        )
+
+        key = self.entity_key(entity)
+        rows = [
+            (key, record["gasDayStart"], json.dumps(record))
+            for record in result.get("data", [])
+            if record.get("gasDayStart")
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO storage VALUES (?, ?, ?)", rows
+            )
+
+        return len(rows)
+
+    def load(
+        self, entities: Optional[Sequence[Entity]] = None
+    ) -> Dict[str, Any]:
+        """Returns the stored records, newest gas day first.
+
+        Parameters
+        ----------
+        entities : Optional[Sequence[Entity]], optional
+            The entities to load, by default all the mirrored entities
+
+        Returns
+        -------
+        Dict[str, Any]
+            Object holding the records, each tagged with its
+            `entity_code`, in the shape of the `query_*_many` results
+        """
+        if entities is None:
+            entities = self.entities
+
+        data: List[Dict[str, Any]] = []
+        for entity in entities:
+            rows = self._connection.execute(
+                "SELECT record FROM storage WHERE entity = ? "
+                "ORDER BY gas_day DESC",
+                (self.entity_key(entity),),
+            )
+            data.extend(
+                dict(json.loads(record), entity_code=entity.code)
+                for (record,) in rows
+            )
+
+        return {"total": len(data), "data": data}
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
@@ -1,4 +1,17 @@
-from typing import Union
+import enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .mappings.agsi_company import AGSICompany
 from .mappings.agsi_country import AGSICountry
@@ -7,8 +20,158 @@ from .mappings.alsi_company import ALSICompany
 from .mappings.alsi_country import ALSICountry
 from .mappings.alsi_facility import ALSIFacility
 
+if TYPE_CHECKING:
+    from .eic_registry import EICRegistry, RegistryEntity
+
+E = TypeVar("E", bound=enum.Enum)
+
+# The API and whether it is a facility of the enums the registry extends
+_REGISTRY_KINDS: Dict[type, Tuple[str, bool]] = {
+    AGSICompany: ("AGSI", False),
+    AGSIFacility: ("AGSI", True),
+    ALSICompany: ("ALSI", False),
+    ALSIFacility: ("ALSI", True),
+}
+
+_REGISTRY: Optional["EICRegistry"] = None
+
+
+class _ReverseIndex(Generic[E]):
+    """Reverse indexes of a mapping enum, built once so that every
+    lookup is a few dictionary reads instead of a scan of the members"""
+
+    def __init__(self, enum_type: Type[E]):
+        """Constructor method for the reverse index
+
+        Parameters
+        ----------
+        enum_type : Type[E]
+            The mapping enum to index
+        """
+        self.enum_type = enum_type
+        self._by_name: Dict[str, E] = dict(enum_type.__members__)
+        self._by_value: Dict[str, E] = {}
+        self._by_folded_name: Dict[str, E] = {}
+        self._by_eic: Dict[str, E] = {}
+        for name, member in enum_type.__members__.items():
+            # Aliases share the member of the first name with their value
+            self._by_value.setdefault(member.value, member)
+            self._by_folded_name.setdefault(name.casefold(), member)
+            self._by_eic.setdefault(member.value.strip().upper(), member)
+
+    def get(self, key: Any) -> Optional[E]:
+        """Returns the member whose name or value (EIC or country code)
+        is the key, None if there is none.
+
+        Exact names and values are matched first, then names ignoring
+        their case and values ignoring case and surrounding whitespace.
+        """
+        member = self._by_name.get(key)
+        if member is None:
+            member = self._by_value.get(key)
+        if member is None and isinstance(key, str):
+            member = self._by_folded_name.get(key.casefold())
+            if member is None:
+                member = self._by_eic.get(key.strip().upper())
+        return member
+
+
+# Built on the first lookup of every enum
+_INDEXES: Dict[type, _ReverseIndex] = {}
+
+
+def _reverse_index(enum_type: Type[E]) -> "_ReverseIndex[E]":
+    index = _INDEXES.get(enum_type)
+    if index is None:
+        index = _INDEXES[enum_type] = _ReverseIndex(enum_type)
+    return index
+
+
+def set_registry(registry: Optional["EICRegistry"]) -> None:
+    """Makes the lookups of companies and facilities fall back to an
+    `eic_registry.EICRegistry` for the keys which are missing from the
+    mapping enums, e.g. facilities newer than the enums.
 
-def lookup_agsi_company(key: Union[AGSICompany, str]) -> AGSICompany:
+    Parameters
+    ----------
+    registry : Optional[EICRegistry]
+        The registry, or None to only look up the mapping enums
+    """
+    global _REGISTRY
+    _REGISTRY = registry
+
+
+def _lookup(
+    key: Any, enum_type: Type[E], use_registry: bool = True
+) -> Optional[Union[E, "RegistryEntity"]]:
+    """Returns the member of a key, or the entity of the registry set
+    with `set_registry` if the enum has none, None if there is none."""
+    member = _reverse_index(enum_type).get(key)
+    if member is not None or not use_registry or _REGISTRY is None:
+        return member
+
+    kind = _REGISTRY_KINDS.get(enum_type)
+    if kind is None or not isinstance(key, str):
+        return None
+    api, facility = kind
+    return _REGISTRY.lookup(key, api, facility)
+
+
+def lookup_many(
+    keys: Iterable[Union[E, str]],
+    enum_type: Type[E],
+    use_registry: bool = True,
+) -> List[Union[E, "RegistryEntity"]]:
+    """Bulk key lookup for any of the mapping enums
+
+    Every key is resolved like the `lookup_*` functions do, through
+    the reverse indexes of the enum and then the registry set with
+    `set_registry`.
+
+    Parameters
+    ----------
+    keys : Iterable[Union[E, str]]
+        The members, names, EICs or country codes to look up
+    enum_type : Type[E]
+        The mapping enum, e.g. AGSIFacility
+    use_registry : bool, optional
+        Fall back to the registry set with `set_registry`, by default True
+
+    Returns
+    -------
+    List[Union[E, RegistryEntity]]
+        The members, or entities of the registry, in the order of the keys
+
+    Raises
+    ------
+    ValueError
+        If any of the keys is invalid, listing all the invalid keys.
+    """
+    members: List[Union[E, "RegistryEntity"]] = []
+    invalid = []
+    for key in keys:
+        if isinstance(key, enum_type):
+            members.append(key)
+            continue
+
+        member = _lookup(key, enum_type, use_registry)
+        if member is None:
+            invalid.append(key)
+        else:
+            members.append(member)
+
+    if invalid:
+        raise ValueError(
+            "The %s keys provided are invalid: %s!"
+            % (enum_type.__name__, ", ".join(map(str, invalid)))
+        )
+
+    return members
+
+
+def lookup_agsi_company(
+    key: Union[AGSICompany, str],
+) -> Union[AGSICompany, "RegistryEntity"]:
     """Key lookup for AGSICompany
 
     If the key is already of type AGSICompany, returns it immediately.
@@ -20,9 +183,10 @@ def lookup_agsi_company(key: Union[AGSICompany, str]) -> AGSICompany:
 
     Returns
     -------
-    AGSICompany
+    Union[AGSICompany, RegistryEntity]
         The corresponding instance of AGSICompany for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key, or the
+        entity of the registry set with `set_registry`.
 
     Raises
     ------
@@ -32,20 +196,17 @@ def lookup_agsi_company(key: Union[AGSICompany, str]) -> AGSICompany:
 
     if isinstance(key, AGSICompany):
         return key
-    else:
-        try:
-            return AGSICompany[key]
-        except KeyError:
-            try:
-                return [obj for obj in AGSICompany if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError(
-                    "The company string provided is invalid!"
-                ) from err
+
+    member = _lookup(key, AGSICompany)
+    if member is None:
+        raise ValueError("The company string provided is invalid!")
+    return member
 
 
 # Checking the provided facility string in our base enums
-def lookup_facility_agsi(key: Union[AGSIFacility, str]) -> AGSIFacility:
+def lookup_facility_agsi(
+    key: Union[AGSIFacility, str],
+) -> Union[AGSIFacility, "RegistryEntity"]:
     """Key lookup for AGSIFacility
 
     If the key is already of type AGSIFacility, returns it immediately.
@@ -57,9 +218,10 @@ def lookup_facility_agsi(key: Union[AGSIFacility, str]) -> AGSIFacility:
 
     Returns
     -------
-    AGSIFacility
+    Union[AGSIFacility, RegistryEntity]
         The corresponding instance of AGSIFacility for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key, or the
+        entity of the registry set with `set_registry`.
 
     Raises
     ------
@@ -69,15 +231,11 @@ def lookup_facility_agsi(key: Union[AGSIFacility, str]) -> AGSIFacility:
 
     if isinstance(key, AGSIFacility):
         return key
-    else:
-        try:
-            return AGSIFacility[key]
-        except KeyError:
 
-            try:
-                return [obj for obj in AGSIFacility if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError("The facility provided is invalid!") from err
+    member = _lookup(key, AGSIFacility)
+    if member is None:
+        raise ValueError("The facility provided is invalid!")
+    return member
 
 
 def lookup_country_agsi(key: Union[AGSICountry, str]) -> AGSICountry:
@@ -92,7 +250,7 @@ def lookup_country_agsi(key: Union[AGSICountry, str]) -> AGSICountry:
     -------
     AGSICountry
         The corresponding instance of AGSICountry for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key.
 
     Raises
     ------
@@ -102,19 +260,16 @@ def lookup_country_agsi(key: Union[AGSICountry, str]) -> AGSICountry:
     """
     if isinstance(key, AGSICountry):
         return key
-    else:
-        try:
-            return AGSICountry[key]
-        except KeyError:
-            try:
-                return [obj for obj in AGSICountry if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError(
-                    "The country string provided is invalid!"
-                ) from err
-
-
-def lookup_alsi_company(key: Union[ALSICompany, str]) -> ALSICompany:
+
+    member = _reverse_index(AGSICountry).get(key)
+    if member is None:
+        raise ValueError("The country string provided is invalid!")
+    return member
+
+
+def lookup_alsi_company(
+    key: Union[ALSICompany, str],
+) -> Union[ALSICompany, "RegistryEntity"]:
     """Key lookup for ALSICompany
 
     Parameters
@@ -124,9 +279,10 @@ def lookup_alsi_company(key: Union[ALSICompany, str]) -> ALSICompany:
 
     Returns
     -------
-    AGSICompany
+    Union[ALSICompany, RegistryEntity]
         The corresponding instance of ALSICompany for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key, or the
+        entity of the registry set with `set_registry`.
 
     Raises
     ------
@@ -136,19 +292,16 @@ def lookup_alsi_company(key: Union[ALSICompany, str]) -> ALSICompany:
     """
     if isinstance(key, ALSICompany):
         return key
-    else:
-        try:
-            return ALSICompany[key]
-        except KeyError:
-            try:
-                return [obj for obj in ALSICompany if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError(
-                    "The company string provided is invalid!"
-                ) from err
-
-
-def lookup_facility_alsi(key: Union[ALSIFacility, str]) -> ALSIFacility:
+
+    member = _lookup(key, ALSICompany)
+    if member is None:
+        raise ValueError("The company string provided is invalid!")
+    return member
+
+
+def lookup_facility_alsi(
+    key: Union[ALSIFacility, str],
+) -> Union[ALSIFacility, "RegistryEntity"]:
     """Key lookup for ALSIFacility
 
     If the key is already of type ALSIFacility, returns it immediately.
@@ -160,9 +313,10 @@ def lookup_facility_alsi(key: Union[ALSIFacility, str]) -> ALSIFacility:
 
     Returns
     -------
-    ALSIFacility
+    Union[ALSIFacility, RegistryEntity]
         The corresponding instance of ALSIFacility for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key, or the
+        entity of the registry set with `set_registry`.
 
     Raises
     ------
@@ -171,16 +325,11 @@ def lookup_facility_alsi(key: Union[ALSIFacility, str]) -> ALSIFacility:
     """
     if isinstance(key, ALSIFacility):
         return key
-    else:
-        try:
-            return ALSIFacility[key]
-        except KeyError:
-            try:
-                return [obj for obj in ALSIFacility if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError(
-                    "The facility string provided is invalid!"
-                ) from err
+
+    member = _lookup(key, ALSIFacility)
+    if member is None:
+        raise ValueError("The facility string provided is invalid!")
+    return member
 
 
 def lookup_country_alsi(key: Union[ALSICountry, str]) -> ALSICountry:
@@ -195,7 +344,7 @@ def lookup_country_alsi(key: Union[ALSICountry, str]) -> ALSICountry:
     -------
     ALSICountry
         The corresponding instance of ALSICountry for which
-        the value equals the lookup key.
+        the name or the value matches the lookup key.
 
     Raises
     ------
@@ -205,13 +354,8 @@ def lookup_country_alsi(key: Union[ALSICountry, str]) -> ALSICountry:
     """
     if isinstance(key, ALSICountry):
         return key
-    else:
-        try:
-            return ALSICountry[key]
-        except KeyError:
-            try:
-                return [obj for obj in ALSICountry if obj.value == key][0]
-            except IndexError as err:
-                raise ValueError(
-                    "The country string provided is invalid!"
-                ) from err
+
+    member = _reverse_index(ALSICountry).get(key)
+    if member is None:
+        raise ValueError("The country string provided is invalid!")
+    return member
@@ -0,0 +1,195 @@
+"""Structured per-request metrics of the clients"""
+
+import statistics
+import time
+import urllib.parse
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+
+class RequestMetrics:
+    """Metrics of one request of a client, from the cache lookup to
+    the decoded response.
+
+    The DNS and connect timings are only measured when the session has
+    the trace config of `create_trace_config`, which sessions created
+    by the clients do. The timings of the network belong to the last
+    attempt, and `connect_time` includes `dns_time`, which the time to
+    first byte `ttfb` includes too. All the times are in seconds.
+    """
+
+    def __init__(self, url: str, params: Dict[str, Any]):
+        """Constructor method for the request metrics
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request
+        params : Dict[str, Any]
+            The query string params of the request
+        """
+        self.url = url
+        self.params = params
+        path = urllib.parse.urlsplit(url).path
+        #: The endpoint, e.g. "news", empty for the storage data
+        self.endpoint = path.rsplit("/api/", 1)[-1].strip("/")
+        self.page = int(params.get("page", 1))
+        #: "memory", "persistent", "coalesced" for a request answered by
+        #: an identical one in flight, or None when the API was queried
+        self.cache: Optional[str] = None
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.response_bytes: Optional[int] = None
+        self.dns_time: Optional[float] = None
+        self.connect_time: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.read_time: Optional[float] = None
+        self.decode_time: Optional[float] = None
+        self.elapsed: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._started = time.perf_counter()
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.cache is not None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Stops the clock of the request."""
+        self.elapsed = time.perf_counter() - self._started
+        self.error = error
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the metrics as a flat dict, e.g. for structured
+        logging."""
+        return {
+            "url": self.url,
+            "endpoint": self.endpoint,
+            "page": self.page,
+            "cache": self.cache,
+            "status": self.status,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "dns_time": self.dns_time,
+            "connect_time": self.connect_time,
+            "ttfb": self.ttfb,
+            "read_time": self.read_time,
+            "decode_time": self.decode_time,
+            "elapsed": self.elapsed,
+            # Not repr, which holds the request headers with the API key
+            "error": (
+                None
+                if self.error is None
+                else "%s: %s" % (type(self.error).__name__, self.error)
+            ),
+        }
+
+    def __repr__(self) -> str:
+        return "RequestMetrics(%s)" % ", ".join(
+            "%s=%r" % item for item in self.as_dict().items()
+        )
+
+
+MetricsHook = Callable[[RequestMetrics], Any]
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Creates an aiohttp trace config measuring the DNS and connect
+    timings of the requests which are sent with a `RequestMetrics` as
+    their `trace_request_ctx`.
+
+    It is added to the sessions the clients create when they have a
+    metrics hook; add it to a session supplied to a client to measure
+    its requests too.
+
+    Returns
+    -------
+    aiohttp.TraceConfig
+        The trace config
+    """
+
+    def metrics_of(context: SimpleNamespace) -> Optional[RequestMetrics]:
+        metrics = context.trace_request_ctx
+        return metrics if isinstance(metrics, RequestMetrics) else None
+
+    async def on_dns_resolvehost_start(session, context, params) -> None:
+        context.dns_start = time.perf_counter()
+
+    async def on_dns_resolvehost_end(session, context, params) -> None:
+        metrics = metrics_of(context)
+        if metrics is not None:
+            metrics.dns_time = time.perf_counter() - context.dns_start
+
+    async def on_connection_create_start(session, context, params) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params) -> None:
+        metrics = metrics_of(context)
+        if metrics is not None:
+            metrics.connect_time = time.perf_counter() - context.connect_start
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+
+class MetricsCollector:
+    """Metrics hook keeping the metrics of every request, with a
+    summary per endpoint"""
+
+    def __init__(self) -> None:
+        self.records: List[RequestMetrics] = []
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        self.records.append(metrics)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the number of requests, cache hits, retries and
+        errors, the response bytes and the median and maximum latency
+        of every endpoint.
+
+        Returns
+        -------
+        Dict[str, Dict[str, Any]]
+            The summary of every endpoint, "" for the storage data
+        """
+        by_endpoint: Dict[str, List[RequestMetrics]] = defaultdict(list)
+        for metrics in self.records:
+            by_endpoint[metrics.endpoint].append(metrics)
+
+        summary = {}
+        for endpoint, records in by_endpoint.items():
+            latencies = [
+                metrics.elapsed
+                for metrics in records
+                if metrics.elapsed is not None
+            ]
+            summary[endpoint] = {
+                "requests": len(records),
+                "cache_hits": sum(metrics.cache_hit for metrics in records),
+                "retries": sum(metrics.retries for metrics in records),
+                "errors": sum(
+                    metrics.error is not None for metrics in records
+                ),
+                "response_bytes": sum(
+                    metrics.response_bytes or 0 for metrics in records
+                ),
+                "median_latency": (
+                    statistics.median(latencies) if latencies else None
+                ),
+                "max_latency": max(latencies) if latencies else None,
+            }
+        return summary
+
+    def clear(self) -> None:
+        self.records.clear()
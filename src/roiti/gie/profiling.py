@@ -0,0 +1,140 @@
+"""Stage-level profiling of the queries of the clients"""
+
+import contextlib
+import contextvars
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional
+
+from .metrics import RequestMetrics
+
+_CURRENT_PROFILE: "contextvars.ContextVar[Optional[QueryProfile]]" = (
+    contextvars.ContextVar("roiti_gie_profile", default=None)
+)
+
+
+class QueryProfile:
+    """Time and allocations spent in every stage of the queries run
+    while the profile is active.
+
+    The network stages, `network_wait` (until the response headers
+    arrive) and `body_read`, and `json_decode` are summed over all the
+    requests, so with concurrent requests they may add up to more than
+    the wall time, which is `elapsed`. Allocations are measured when
+    tracemalloc is tracing, as the net bytes still allocated at the end
+    of a stage, and only for the stages which do not wait for the
+    network, as other tasks allocate while a request is waiting.
+    """
+
+    def __init__(self) -> None:
+        self.stages: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.requests = 0
+        self.cache_hits = 0
+        self.elapsed: Optional[float] = None
+        self._started = time.perf_counter()
+
+    def add(
+        self, name: str, seconds: float, allocated: Optional[int] = None
+    ) -> None:
+        """Adds time, and optionally allocated bytes, to a stage."""
+        stage = self.stages.setdefault(
+            name, {"time": 0.0, "calls": 0, "allocated": None}
+        )
+        stage["time"] += seconds
+        stage["calls"] += 1
+        if allocated is not None:
+            stage["allocated"] = (stage["allocated"] or 0) + allocated
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measures the time and the allocations of a block of code
+        which does not wait for the network."""
+        tracing = tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            allocated = (
+                tracemalloc.get_traced_memory()[0] - before
+                if tracing
+                else None
+            )
+            self.add(name, seconds, allocated)
+
+    def add_request(self, metrics: RequestMetrics) -> None:
+        """Adds the network and decode timings of a finished request."""
+        self.requests += 1
+        if metrics.cache_hit:
+            self.cache_hits += 1
+        for name, seconds in (
+            ("network_wait", metrics.ttfb),
+            ("body_read", metrics.read_time),
+            ("json_decode", metrics.decode_time),
+        ):
+            if seconds is not None:
+                self.add(name, seconds)
+
+    def finish(self) -> None:
+        """Stops the clock of the profile."""
+        self.elapsed = time.perf_counter() - self._started
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the profile as a dict, e.g. for structured logging."""
+        return {
+            "elapsed": self.elapsed,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "stages": {
+                name: dict(stage) for name, stage in self.stages.items()
+            },
+        }
+
+    def __repr__(self) -> str:
+        return "QueryProfile(%r)" % (self.as_dict(),)
+
+
+def current_profile() -> Optional[QueryProfile]:
+    """Returns the active profile, None when nothing is profiled."""
+    return _CURRENT_PROFILE.get()
+
+
+@contextlib.contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """Measures a stage into the active profile, if there is one."""
+    profile = _CURRENT_PROFILE.get()
+    if profile is None:
+        yield
+        return
+
+    with profile.stage(name):
+        yield
+
+
+@contextlib.contextmanager
+def activate(
+    profile: QueryProfile, trace_allocations: bool = False
+) -> Iterator[QueryProfile]:
+    """Makes a profile the active one in the current context, and in
+    the tasks created from it, until the block is left.
+
+    Parameters
+    ----------
+    profile : QueryProfile
+        The profile
+    trace_allocations : bool, optional
+        Start tracemalloc for the block when it is not tracing already, by default False
+    """
+    start_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    token = _CURRENT_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        _CURRENT_PROFILE.reset(token)
+        profile.finish()
+        if start_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,117 @@
+"""A client side rate limiter shared by the requests of a client"""
+
+import asyncio
+import datetime
+import email.utils
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Token bucket rate limiter which can also be paused, e.g. when the
+    API answers with 429 Too Many Requests"""
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1):
+        """Constructor method for the rate limiter
+
+        Parameters
+        ----------
+        rate : Optional[float], optional
+            Requests per second allowed on average, or None for no limit, by default None
+        burst : int, optional
+            Number of requests which may be sent at once after a quiet period, by default 1
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("The rate must be a positive number!")
+        if burst < 1:
+            raise ValueError("The burst must be a positive integer!")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Waits until a request may be sent."""
+        if self.rate is None and time.monotonic() >= self._paused_until:
+            return
+
+        # Created lazily so that the lock belongs to the running loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.rate is None:
+                        return
+
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                    wait = (1 - self._tokens) / self.rate
+
+                await asyncio.sleep(wait)
+
+    def pause(self, delay: float) -> None:
+        """Holds back every request for `delay` seconds.
+
+        Parameters
+        ----------
+        delay : float
+            Number of seconds to wait before sending the next request
+        """
+        paused_until = time.monotonic() + max(delay, 0.0)
+        if paused_until > self._paused_until:
+            self._paused_until = paused_until
+            self._tokens = 0.0
+            self._updated = paused_until
+
+    def _refill(self, now: float) -> None:
+        """Adds the tokens earned since the last refill."""
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(
+            self._tokens + elapsed * (self.rate or 0.0), float(self.burst)
+        )
+        self._updated = max(now, self._updated)
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parses a Retry-After header to a number of seconds.
+
+    Parameters
+    ----------
+    value : Optional[str]
+        The header value, either a number of seconds or an HTTP date
+    default : float, optional
+        Delay returned when the header is missing or invalid, by default 1.0
+
+    Returns
+    -------
+    float
+        The number of seconds to wait
+    """
+    if not value:
+        return default
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+
+    delay = retry_at - datetime.datetime.now(datetime.timezone.utc)
+    return max(delay.total_seconds(), 0.0)
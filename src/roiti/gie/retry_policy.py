@@ -0,0 +1,99 @@
+"""A retry policy for transient request failures"""
+
+import asyncio
+import random
+from typing import Iterable, Optional, Tuple, Type
+
+import aiohttp
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """Retry policy with exponential backoff and jitter"""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Optional[Iterable[int]] = None,
+        retry_exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
+    ):
+        """Constructor method for the retry policy
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Number of times a request is sent before giving up, by default 5
+        backoff_base : float, optional
+            Delay in seconds before the first retry, doubled on every retry, by default 0.5
+        backoff_cap : float, optional
+            Maximum delay in seconds between two attempts, by default 30.0
+        jitter : bool, optional
+            Randomize the delays between 0 and the backoff, by default True
+        retry_statuses : Optional[Iterable[int]], optional
+            HTTP statuses which are retried, by default 429, 500, 502, 503 and 504
+        retry_exceptions : Optional[Tuple[Type[BaseException], ...]], optional
+            Exceptions which are retried, by default connection, payload and timeout errors
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer!")
+        if backoff_base < 0 or backoff_cap < 0:
+            raise ValueError("The backoff must not be negative!")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = (
+            frozenset(retry_statuses)
+            if retry_statuses is not None
+            else DEFAULT_RETRY_STATUSES
+        )
+        self.retry_exceptions = (
+            retry_exceptions
+            if retry_exceptions is not None
+            else DEFAULT_RETRY_EXCEPTIONS
+        )
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Returns whether the failed request may be sent again.
+
+        Parameters
+        ----------
+        error : BaseException
+            The error the request failed with
+
+        Returns
+        -------
+        bool
+            True if the status or the type of the error is retryable
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self.retry_statuses
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of the attempt which failed, starting from 1
+
+        Returns
+        -------
+        float
+            The number of seconds to wait
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
@@ -0,0 +1,160 @@
+"""Transports sending the requests of the clients"""
+
+import gzip
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from .cache import cache_key
+from .exceptions import CassetteMissError
+from .metrics import RequestMetrics
+
+
+class Transport:
+    """Sends GET requests through the session of a client"""
+
+    #: Whether the requests reach the API, and so are rate limited
+    uses_network = True
+
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict[str, Any],
+        metrics: Optional[RequestMetrics] = None,
+    ) -> bytes:
+        """Sends a GET request and returns the raw response body.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The session of the client
+        url : str
+            The URL to query
+        params : Dict[str, Any]
+            The query string params
+        metrics : Optional[RequestMetrics], optional
+            The metrics of the request, given its status, time to first
+            byte and body read time, and passed to the trace configs of
+            the session as `trace_request_ctx`, by default None
+
+        Returns
+        -------
+        bytes
+            The response body
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            If the API answers with an error status, holding the
+            response headers
+        """
+        started = time.perf_counter()
+        async with session.get(
+            url,
+            params=params,
+            raise_for_status=False,
+            trace_request_ctx=metrics,
+        ) as resp:
+            if metrics is not None:
+                metrics.status = resp.status
+                metrics.ttfb = time.perf_counter() - started
+            resp.raise_for_status()
+            if metrics is None:
+                return await resp.read()
+
+            started = time.perf_counter()
+            body = await resp.read()
+            metrics.read_time = time.perf_counter() - started
+            return body
+
+    async def close(self) -> None:
+        """Releases the resources of the transport, called when the
+        session of the client is closed."""
+
+
+class CassetteTransport(Transport):
+    """Records the responses of the API to a cassette file or replays
+    them from it without network access.
+
+    A cassette is a gzipped JSON file mapping the normalized URL and
+    params of every request, as in `cache.cache_key`, to its response
+    body. The API key is sent as a header, so it is never recorded.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        """Constructor method for the cassette transport
+
+        Parameters
+        ----------
+        path : str
+            The path of the cassette file
+        mode : str, optional
+            "record" to query the API and add its responses to the cassette, which is written when
+            the session of the client is closed, or "replay" to answer every request from the
+            cassette, by default "replay"
+
+        Raises
+        ------
+        ValueError
+            If the mode is invalid
+        FileNotFoundError
+            If the cassette to replay does not exist
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError("mode must be 'record' or 'replay'!")
+
+        self.path = path
+        self.mode = mode
+        self.uses_network = mode == self.RECORD
+        self._interactions: Dict[str, str] = {}
+        self._modified = False
+
+        if mode == self.REPLAY or os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                self._interactions = json.load(file)["interactions"]
+
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Dict[str, Any],
+        metrics: Optional[RequestMetrics] = None,
+    ) -> bytes:
+        key = cache_key(url, params)
+        if self.mode == self.REPLAY:
+            body = self._interactions.get(key)
+            if body is None:
+                raise CassetteMissError(
+                    "The request %s is not in the cassette %s!"
+                    % (key, self.path)
+                )
+            return body.encode("utf-8")
+
+        raw_body = await super().get(session, url, params, metrics)
+        self._interactions[key] = raw_body.decode("utf-8")
+        self._modified = True
+        return raw_body
+
+    async def close(self) -> None:
+        if self._modified:
+            self.save()
+
+    def save(self) -> None:
+        """Writes the recorded responses to the cassette file."""
+        tmp_path = "%s.%s.tmp" % (self.path, os.getpid())
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+            json.dump(
+                {"interactions": self._interactions}, file, sort_keys=True
+            )
+        os.replace(tmp_path, self.path)
+        self._modified = False
+
+    def __len__(self) -> int:
+        return len(self._interactions)
@@ -0,0 +1,90 @@
+import asyncio
+import gzip
+import json
+import time
+
+import aiohttp
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from roiti.gie.cache import cache_key
+from roiti.gie.transport import Transport
+
+
+class StubTransport(Transport):
+    """Answers every request with the next of the given responses, the
+    last one repeated, after `delay` seconds. It stands in for the API,
+    so its requests wait for the rate limiter of the client.
+
+    A response is a JSON body answered with 200, a (status, headers)
+    tuple answered with that error status, or a function of the URL and
+    the params returning one of those. The requests are recorded as
+    (monotonic time, URL, params) in `requests`, and the most requests
+    in flight at once in `max_in_flight`.
+    """
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, session, url, params, metrics=None):
+        self.requests.append((time.monotonic(), url, dict(params)))
+        response = (
+            self.responses.pop(0)
+            if len(self.responses) > 1
+            else self.responses[0]
+        )
+        if callable(response):
+            response = response(url, params)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if isinstance(response, tuple):
+            status, headers = response
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(
+                    url=URL(url),
+                    method="GET",
+                    headers=CIMultiDictProxy(CIMultiDict()),
+                    real_url=URL(url),
+                ),
+                (),
+                status=status,
+                headers=CIMultiDict(headers),
+            )
+        return json.dumps(response).encode("utf-8")
+
+
+@pytest.fixture
+def stub_transport():
+    """Returns the `StubTransport` class."""
+    return StubTransport
+
+
+@pytest.fixture
+def make_cassette(tmp_path):
+    """Returns a function writing a cassette which answers the given
+    (url, params, body) interactions, and returning its path."""
+
+    def make(*interactions):
+        path = str(tmp_path / "cassette.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "interactions": {
+                        cache_key(url, params): json.dumps(body)
+                        for url, params, body in interactions
+                    }
+                },
+                file,
+            )
+        return path
+
+    return make
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from decouple import config
+
+pyarrow = pytest.importorskip("pyarrow")
+
+from roiti.gie.gie_arrow_client import GieArrowClient  # noqa: E402
+from roiti.gie.mappings.api_mappings import APIType  # noqa: E402
+from roiti.gie.transport import CassetteTransport  # noqa: E402
+
+API_KEY = config("API_KEY")
+
+
+class TestArrowGieClient:
+    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(scope="class")
+    async def client(self):
+        arrow_client = GieArrowClient(api_key=API_KEY)
+
+        yield arrow_client
+
+        await arrow_client.close_session()
+
+    @pytest_asyncio.fixture(scope="class")
+    def event_loop(self):
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage(self, client):
+        result = await client.query_country_agsi_storage("AT", size=60)
+        assert isinstance(result, pyarrow.Table)
+        assert result.schema.field("full").type == pyarrow.float64()
+        assert result.schema.field("gasDayStart").type == pyarrow.date32()
+
+    @pytest.mark.asyncio
+    async def test_query_alsi_eic_listing(self, client):
+        result = await client.query_alsi_eic_listing()
+        assert isinstance(result, pyarrow.Table)
+        assert result.column_names[:3] == ["name", "short_name", "eic"]
+
+    @pytest.mark.asyncio
+    async def test_iter_country_agsi_storage(self, client):
+        batches = [
+            batch
+            async for batch in client.iter_country_agsi_storage(
+                "AT", start="2022-01-01", end="2022-03-31", size=30
+            )
+        ]
+        assert len(batches) > 1
+        assert all(batch.schema == batches[0].schema for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 90
+
+    @pytest.mark.asyncio
+    async def test_arrow_table_with_placeholders(self, client):
+        result = client._arrow_table(
+            {
+                "data": [
+                    {"code": "AT", "full": "50.1", "info": [{"a": 1}]},
+                    {"code": "DE", "full": "-", "trend": 1.5},
+                ]
+            },
+            client._STORAGE_FIELDS,
+        )
+        assert result.column("full").to_pylist() == [50.1, None]
+        assert result.column("trend").to_pylist() == [None, 1.5]
+        assert result.column("info").to_pylist() == ['[{"a": 1}]', None]
+        assert result.schema.field("code").type == pyarrow.dictionary(
+            pyarrow.int32(), pyarrow.string()
+        )
+
+    @pytest.mark.asyncio
+    async def test_arrow_client_with_float32(self):
+        arrow_client = GieArrowClient(api_key=API_KEY, float_dtype="float32")
+        result = arrow_client._arrow_table(
+            {"data": [{"full": "51.2"}]}, arrow_client._STORAGE_FIELDS
+        )
+        assert result.schema.field("full").type == pyarrow.float32()
+        await arrow_client.close_session()
+
+        with pytest.raises(ValueError):
+            GieArrowClient(api_key=API_KEY, float_dtype="int64")
+
+    @pytest.mark.asyncio
+    async def test_arrow_client_alsi_schema_offline(self, make_cassette):
+        path = make_cassette(
+            (
+                APIType.ALSI.value,
+                {"country": "BE"},
+                {
+                    "data": [
+                        {
+                            "code": "BE",
+                            "gasDayStart": "2022-01-01",
+                            "inventory": {"lng": "240.7", "gwh": "1652.3"},
+                            "sendOut": "86.5",
+                            "dtmi": {"lng": "380", "gwh": "-"},
+                        }
+                    ],
+                },
+            )
+        )
+
+        arrow_client = GieArrowClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        result = await arrow_client.query_country_alsi_storage("BE")
+        await arrow_client.close_session()
+
+        assert "inventory" not in result.column_names
+        assert "dtmi" not in result.column_names
+        for name in ("inventory_lng", "inventory_gwh", "dtmi_lng"):
+            assert result.schema.field(name).type == pyarrow.float64()
+        assert result.column("inventory_lng").to_pylist() == [240.7]
+        assert result.column("inventory_gwh").to_pylist() == [1652.3]
+        assert result.column("dtmi_lng").to_pylist() == [380.0]
+        assert result.column("dtmi_gwh").to_pylist() == [None]
+        assert result.column("sendOut").to_pylist() == [86.5]
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from decouple import config
+
+from roiti.gie.eic_registry import EICRegistry
+from roiti.gie.gie_raw_client import GieRawClient
+from roiti.gie.gie_sync_client import GieSyncClient
+from roiti.gie.lookup_functions import lookup_facility_agsi, set_registry
+from roiti.gie.mappings.agsi_facility import AGSIFacility
+from roiti.gie.mappings.api_mappings import APIType
+
+API_KEY = config("API_KEY")
+
+
+class TestEICRegistry:
+    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(scope="class")
+    async def client(self):
+        raw_client = GieRawClient(api_key=API_KEY)
+
+        yield raw_client
+
+        await raw_client.close_session()
+
+    @pytest_asyncio.fixture(scope="class")
+    def event_loop(self):
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_registry_falls_back_to_the_enums(self, client, tmp_path):
+        registry = EICRegistry(client, str(tmp_path / "eic.json.gz"))
+        facility = AGSIFacility.ugs_rehden
+
+        assert registry.stale
+        assert registry.get("UGS_Rehden")["eic"] == facility.code
+        assert registry.get_params(facility.code) == facility.get_params()
+        assert registry.by_eic(facility.code) in registry.by_country(
+            "DE", APIType.AGSI
+        )
+        with pytest.raises(ValueError):
+            registry.get_params("Moria")
+
+    @pytest.mark.asyncio
+    async def test_registry_refresh(self, client, tmp_path):
+        path = str(tmp_path / "eic.json.gz")
+        registry = EICRegistry(client, path)
+
+        assert await registry.refresh()
+        assert not registry.stale
+        assert not await registry.refresh()
+        assert registry.by_country("DE", APIType.AGSI)
+
+        reloaded = EICRegistry(client, path)
+        assert reloaded.fetched_at == registry.fetched_at
+        assert len(reloaded) == len(registry)
+
+    @pytest.mark.asyncio
+    async def test_registry_extends_the_lookups_offline(
+        self, stub_transport, tmp_path
+    ):
+        company = {
+            "name": "New Storage",
+            "eic": "21X-NEW-STORAGE",
+            "country": {"code": "DE"},
+        }
+        facility = {
+            "name": "UGS Newfield",
+            "eic": "21W-UGS-NEWFIELD",
+            "country": {"code": "DE"},
+        }
+
+        def listing(url, params):
+            if "agsi" in url:
+                return {
+                    "SSO": {
+                        "Europe": {
+                            "DE": [dict(company, facilities=[facility])]
+                        }
+                    }
+                }
+            return {"LSO": {"Europe": {"DE": [dict(company, facilities=[])]}}}
+
+        transport = stub_transport(listing)
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport
+        )
+        registry = EICRegistry(raw_client, str(tmp_path / "eic.json.gz"))
+        await registry.refresh()
+
+        assert (
+            registry.by_eic("21X-NEW-STORAGE", APIType.ALSI)["api"] == "ALSI"
+        )
+        with pytest.raises(ValueError):
+            registry.get_params("21X-NEW-STORAGE")
+        assert registry.get_params("UGS Newfield") == {
+            "country": "DE",
+            "company": "21X-NEW-STORAGE",
+            "facility": "21W-UGS-NEWFIELD",
+        }
+
+        with pytest.raises(ValueError):
+            lookup_facility_agsi("UGS Newfield")
+        set_registry(registry)
+        try:
+            assert lookup_facility_agsi("ugs newfield").code == (
+                "21W-UGS-NEWFIELD"
+            )
+            transport.responses = [{"data": []}]
+            await raw_client.query_agsi_facility_storage("UGS Newfield")
+        finally:
+            set_registry(None)
+        await raw_client.close_session()
+
+        _, _, params = transport.requests[-1]
+        assert params["facility"] == "21W-UGS-NEWFIELD"
+        assert params["company"] == "21X-NEW-STORAGE"
+
+    def test_registry_rejects_the_sync_client_offline(self):
+        sync_client = GieSyncClient(api_key="NO_NETWORK_NEEDED")
+        try:
+            with pytest.raises(TypeError):
+                EICRegistry(sync_client)
+        finally:
+            sync_client.close()
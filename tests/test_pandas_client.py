@@ -1,6 +1,7 @@
 import asyncio
 import sys
 
+import pandas
 import pandas.core.frame
 import pytest
 import pytest_asyncio
@@ -8,6 +9,8 @@ from decouple import config
 
 from roiti.gie.exceptions import ApiError
 from roiti.gie.gie_pandas_client import GiePandasClient
+from roiti.gie.mappings.api_mappings import APIType
+from roiti.gie.transport import CassetteTransport
 
 API_KEY = config("API_KEY")
 
@@ -178,3 +181,199 @@ class TestPandasGieClient:
     async def test_query_alsi_company_with_incorrect_company(self, client):
         with pytest.raises(ValueError):
             await client.query_alsi_company("Moria")
+
+    @pytest.mark.asyncio
+    async def test_query_agsi_facility_storage_all_pages(self, client):
+        result = await client.query_agsi_facility_storage(
+            "ugs_berlin", start="2021-01-01", end="2021-12-31", all_pages=True
+        )
+        assert isinstance(result, pandas.core.frame.DataFrame)
+        assert len(result) == 365
+
+    @pytest.mark.asyncio
+    async def test_iter_country_agsi_storage(self, client):
+        async for result in client.iter_country_agsi_storage(
+            "DE", start="2021-01-01", end="2021-12-31"
+        ):
+            assert isinstance(result, pandas.core.frame.DataFrame)
+
+    @pytest.mark.asyncio
+    async def test_query_country_alsi_storage_many(self, client):
+        result = await client.query_country_alsi_storage_many(
+            ["BE", "FR"], date="2022-01-01"
+        )
+        assert isinstance(result, pandas.core.frame.DataFrame)
+        assert set(result["entity_code"]) == {"BE", "FR"}
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage_dtypes(self, client):
+        result = await client.query_country_agsi_storage("AT", size=60)
+        assert pandas.api.types.is_float_dtype(result["gasInStorage"])
+        assert pandas.api.types.is_float_dtype(result["full"])
+        assert pandas.api.types.is_datetime64_any_dtype(result["gasDayStart"])
+        assert isinstance(result["code"].dtype, pandas.CategoricalDtype)
+
+    @pytest.mark.asyncio
+    async def test_pandas_client_with_float32(self):
+        pandas_client = GiePandasClient(api_key=API_KEY, float_dtype="float32")
+        result = pandas_client._pandas_df_format(
+            {"data": [{"full": "51.2"}, {"full": "-"}]},
+            pandas_client._FLOATING_COLS,
+        )
+        assert result["full"].dtype == "float32"
+        assert result["full"].isna().tolist() == [False, True]
+        await pandas_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_pandas_df_format_with_different_record_keys(self, client):
+        result = client._pandas_df_format(
+            {
+                "gas_day": "2022-01-02",
+                "data": [
+                    {"code": "AT", "full": "50.1"},
+                    {"code": "DE", "full": "60.2", "trend": "0.3"},
+                ],
+            },
+            client._FLOATING_COLS,
+        )
+        assert list(result.columns) == ["gas_day", "code", "full", "trend"]
+        assert result["trend"].isna().tolist() == [True, False]
+        assert (result["gas_day"] == pandas.Timestamp("2022-01-02")).all()
+
+    @pytest.mark.asyncio
+    async def test_pandas_client_with_flatten_children(self):
+        pandas_client = GiePandasClient(api_key=API_KEY, flatten_children=True)
+        result = pandas_client._pandas_df_format(
+            {
+                "data": [
+                    {
+                        "code": "DE",
+                        "gasDayStart": "2022-01-02",
+                        "full": "50.1",
+                        "children": [
+                            {
+                                "code": "21X",
+                                "full": "40.2",
+                                "children": [{"code": "21W", "full": "-"}],
+                            }
+                        ],
+                    }
+                ]
+            },
+            pandas_client._FLOATING_COLS,
+        )
+        assert "children" not in result.columns
+        assert result["code"].tolist() == ["DE", "21X", "21W"]
+        assert result["level"].tolist() == [0, 1, 2]
+        assert result["parent_code"].tolist()[1:] == ["DE", "21X"]
+        assert set(result["country"]) == {"DE"}
+        assert result["gasDayStart"].notna().all()
+        await pandas_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_pandas_client_profile_offline(self, make_cassette):
+        path = make_cassette(
+            (
+                APIType.AGSI.value,
+                {"country": "AT"},
+                {
+                    "gas_day": "2022-01-02",
+                    "data": [{"code": "AT", "full": "50.1"}],
+                },
+            )
+        )
+
+        profiles = []
+        pandas_client = GiePandasClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        with pandas_client.profile(profiles.append, True) as profile:
+            result = await pandas_client.query_country_agsi_storage("AT")
+        await pandas_client.query_country_agsi_storage("AT")
+        await pandas_client.close_session()
+
+        assert result["full"].tolist() == [50.1]
+        assert profiles == [profile]
+        assert profile.requests == 1 and profile.elapsed is not None
+        stages = profile.as_dict()["stages"]
+        assert {
+            "json_decode",
+            "dataframe_construction",
+            "gas_day_insertion",
+            "float_conversion",
+        } <= set(stages)
+        assert stages["float_conversion"]["allocated"] is not None
+
+    @pytest.mark.asyncio
+    async def test_pandas_client_expands_nested_alsi_columns_offline(
+        self, make_cassette
+    ):
+        path = make_cassette(
+            (
+                APIType.ALSI.value,
+                {"country": "BE"},
+                {
+                    "gas_day": "2022-01-01",
+                    "data": [
+                        {
+                            "code": "BE",
+                            "gasDayStart": "2022-01-01",
+                            "inventory": {"lng": "240.7", "gwh": "1652.3"},
+                            "sendOut": "86.5",
+                            "dtmi": {"lng": "380", "gwh": "-"},
+                            "dtrs": "396.1",
+                        }
+                    ],
+                },
+            )
+        )
+
+        pandas_client = GiePandasClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        result = await pandas_client.query_country_alsi_storage("BE")
+        await pandas_client.close_session()
+
+        assert "inventory" not in result and "dtmi" not in result
+        assert result["inventory_lng"].tolist() == [240.7]
+        assert result["inventory_gwh"].tolist() == [1652.3]
+        assert result["dtmi_lng"].tolist() == [380.0]
+        assert result["dtmi_gwh"].isna().all()
+        assert result["sendOut"].tolist() == [86.5]
+        assert list(result.columns).index("inventory_lng") < list(
+            result.columns
+        ).index("sendOut")
+
+    @pytest.mark.asyncio
+    async def test_pandas_client_iter_keeps_gas_day_offline(
+        self, make_cassette
+    ):
+        path = make_cassette(
+            (
+                APIType.AGSI.value,
+                {"country": "AT", "date": "2022-01-02"},
+                {
+                    "gas_day": "2022-01-02",
+                    "last_page": 1,
+                    "data": [{"code": "AT", "full": "50.1"}],
+                },
+            )
+        )
+
+        pandas_client = GiePandasClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        pages = [
+            page
+            async for page in pandas_client.iter_country_agsi_storage(
+                "AT", date="2022-01-02"
+            )
+        ]
+        result = await pandas_client.query_country_agsi_storage(
+            "AT", date="2022-01-02"
+        )
+        await pandas_client.close_session()
+
+        assert len(pages) == 1
+        pandas.testing.assert_frame_equal(pages[0], result)
+        assert pages[0]["gas_day"].tolist() == [pandas.Timestamp("2022-01-02")]
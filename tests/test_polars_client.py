@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from decouple import config
+
+polars = pytest.importorskip("polars")
+
+from roiti.gie.gie_polars_client import GiePolarsClient  # noqa: E402
+from roiti.gie.mappings.api_mappings import APIType  # noqa: E402
+from roiti.gie.transport import CassetteTransport  # noqa: E402
+
+API_KEY = config("API_KEY")
+
+
+class TestPolarsGieClient:
+    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(scope="class")
+    async def client(self):
+        polars_client = GiePolarsClient(api_key=API_KEY)
+
+        yield polars_client
+
+        await polars_client.close_session()
+
+    @pytest_asyncio.fixture(scope="class")
+    def event_loop(self):
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage(self, client):
+        result = await client.query_country_agsi_storage("AT", size=60)
+        assert isinstance(result, polars.DataFrame)
+        assert result.schema["full"] == polars.Float64
+        assert result.schema["gasDayStart"] == polars.Date
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage_all_pages(self, client):
+        result = await client.query_country_agsi_storage(
+            "AT", start="2022-01-01", end="2022-03-31", size=30, all_pages=True
+        )
+        assert isinstance(result, polars.LazyFrame)
+        assert result.collect().height == 90
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage_many(self, client):
+        result = await client.query_country_agsi_storage_many(
+            ["AT", "DE"], date="2022-01-01"
+        )
+        assert isinstance(result, polars.LazyFrame)
+        entity_codes = result.select("entity_code").collect()
+        assert set(entity_codes["entity_code"]) == {"AT", "DE"}
+
+    @pytest.mark.asyncio
+    async def test_iter_country_agsi_storage(self, client):
+        frames = [
+            frame
+            async for frame in client.iter_country_agsi_storage(
+                "AT", start="2022-01-01", end="2022-03-31", size=30
+            )
+        ]
+        assert all(isinstance(frame, polars.DataFrame) for frame in frames)
+        assert sum(frame.height for frame in frames) == 90
+
+    @pytest.mark.asyncio
+    async def test_polars_client_offline(self, make_cassette):
+        path = make_cassette(
+            (
+                APIType.AGSI.value,
+                {"country": "AT"},
+                {
+                    "data": [
+                        {
+                            "code": "AT",
+                            "gasDayStart": "2022-01-01",
+                            "full": "50.1",
+                        },
+                        {"code": "AT", "gasDayStart": "-", "full": "-"},
+                    ]
+                },
+            ),
+            (
+                APIType.ALSI.value,
+                {"country": "BE"},
+                {
+                    "data": [
+                        {
+                            "code": "BE",
+                            "inventory": {"lng": "240.7", "gwh": "1652.3"},
+                        }
+                    ]
+                },
+            ),
+        )
+
+        polars_client = GiePolarsClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        agsi = await polars_client.query_country_agsi_storage("AT")
+        alsi = await polars_client.query_country_alsi_storage("BE")
+        await polars_client.close_session()
+
+        assert isinstance(agsi, polars.DataFrame)
+        assert agsi.schema["full"] == polars.Float64
+        assert agsi.schema["gasDayStart"] == polars.Date
+        assert agsi["full"].to_list() == [50.1, None]
+        assert alsi["inventory_lng"].to_list() == [240.7]
+        assert alsi["inventory_gwh"].to_list() == [1652.3]
@@ -1,12 +1,31 @@
 import asyncio
+import json
+import subprocess
+import sys
 
 import pytest
 import pytest_asyncio
 from aiohttp import ClientResponseError
 from decouple import config
 
-from roiti.gie.exceptions import ApiError
+from roiti.gie.cache import (
+    CachePolicy,
+    FileCache,
+    MemoryCache,
+    SQLiteCache,
+)
+from roiti.gie.connection import create_connector
+from roiti.gie.entity_graph import agsi_graph
+from roiti.gie.exceptions import ApiError, CassetteMissError
 from roiti.gie.gie_raw_client import GieRawClient
+from roiti.gie.lookup_functions import lookup_facility_agsi, lookup_many
+from roiti.gie.mappings.agsi_company import AGSICompany
+from roiti.gie.mappings.agsi_country import AGSICountry
+from roiti.gie.mappings.agsi_facility import AGSIFacility
+from roiti.gie.mappings.api_mappings import APIType
+from roiti.gie.metrics import MetricsCollector
+from roiti.gie.retry_policy import RetryPolicy
+from roiti.gie.transport import CassetteTransport
 
 API_KEY = config("API_KEY")
 
@@ -160,6 +179,472 @@ class TestRawGieClient:
         with pytest.raises(ValueError):
             await client[0].query_alsi_company("Moria")
 
+    @pytest.mark.asyncio
+    async def test_query_agsi_facility_storage_all_pages(self, client):
+        result = await client[0].query_agsi_facility_storage(
+            "ugs_berlin", start="2021-01-01", end="2021-12-31", all_pages=True
+        )
+        assert len(result["data"]) == result["total"]
+
+    @pytest.mark.asyncio
+    async def test_iter_agsi_facility_storage(self, client):
+        records = []
+        async for page in client[0].iter_agsi_facility_storage(
+            "ugs_berlin", start="2021-01-01", end="2021-12-31"
+        ):
+            records.extend(page)
+        assert len(records) == 365
+
+    @pytest.mark.asyncio
+    async def test_iter_country_agsi_storage_with_incorrect_country(
+        self, client
+    ):
+        with pytest.raises(ValueError):
+            async for _ in client[0].iter_country_agsi_storage("Moria"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_query_country_agsi_storage_sharded_by_date(self, client):
+        result = await client[0].query_country_agsi_storage(
+            "AT", start="2019-01-01", end="2021-12-31", all_pages=True
+        )
+        gas_days = [record["gasDayStart"] for record in result["data"]]
+        assert gas_days == sorted(set(gas_days), reverse=True)
+        assert len(gas_days) == 1096
+
+    @pytest.mark.asyncio
+    async def test_query_agsi_facility_storage_many(self, client):
+        result = await client[0].query_agsi_facility_storage_many(
+            ["ugs_berlin", "ugs_rehden"], date="2022-01-01"
+        )
+        assert {record["entity_code"] for record in result["data"]} == {
+            "21W0000000001083",
+            "21Z000000000271O",
+        }
+
+    @pytest.mark.asyncio
+    async def test_query_agsi_company_many_with_incorrect_company(
+        self, client
+    ):
+        with pytest.raises(ValueError):
+            await client[0].query_agsi_company_many(["astora", "Moria"])
+
+    @pytest.mark.asyncio
+    async def test_raw_client_only_shards_all_pages_queries(
+        self, stub_transport
+    ):
+        transport = stub_transport(
+            lambda url, params: {
+                "last_page": 1 if "page" in params else 2,
+                "data": [
+                    {
+                        "gasDayStart": params["to"],
+                        "code": "AT",
+                        "page": params.get("page", 1),
+                    }
+                ],
+            }
+        )
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport, window_days=365
+        )
+
+        await raw_client.query_country_agsi_storage(
+            "AT", start="2020-01-01", end="2021-12-31"
+        )
+        ((_, _, params),) = transport.requests
+        assert (params["from"], params["to"]) == ("2020-01-01", "2021-12-31")
+
+        result = await raw_client.query_country_agsi_storage(
+            "AT", start="2020-01-01", end="2021-12-31", all_pages=True
+        )
+        windows = sorted(
+            (params["from"], params["to"])
+            for _, _, params in transport.requests[1:]
+        )
+        assert windows == [
+            ("2020-01-01", "2020-01-01"),
+            ("2020-01-01", "2020-01-01"),
+            ("2020-01-02", "2020-12-31"),
+            ("2020-01-02", "2020-12-31"),
+            ("2021-01-01", "2021-12-31"),
+            ("2021-01-01", "2021-12-31"),
+        ]
+        assert result["last_page"] == 1
+        assert result["total"] == len(result["data"]) == 3
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_many_all_pages_respects_max_concurrency(
+        self, stub_transport
+    ):
+        transport = stub_transport(
+            {"last_page": 4, "data": [{"code": "AT"}]}, delay=0.01
+        )
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED",
+            transport=transport,
+            max_concurrency=3,
+        )
+
+        result = await raw_client.query_country_agsi_storage_many(
+            ["AT", "DE", "FR", "IT", "NL"], all_pages=True
+        )
+        await raw_client.close_session()
+
+        assert result["total"] == 20
+        assert len(transport.requests) == 20
+        assert transport.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_package_import_is_lazy(self):
+        code = (
+            "import sys, roiti.gie; "
+            "print(any(name in sys.modules for name in ('aiohttp', 'pandas')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            universal_newlines=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.asyncio
+    async def test_lookup_facility_agsi_by_name_and_eic(self):
+        facility = AGSIFacility.ugs_rehden
+        assert lookup_facility_agsi("UGS_Rehden") is facility
+        assert lookup_facility_agsi(facility.value) is facility
+        assert lookup_facility_agsi(facility.value.lower()) is facility
+
+    @pytest.mark.asyncio
+    async def test_lookup_many(self):
+        assert lookup_many(["AT", AGSICountry.DE, "fr"], AGSICountry) == [
+            AGSICountry.AT,
+            AGSICountry.DE,
+            AGSICountry.FR,
+        ]
+        with pytest.raises(ValueError, match="Moria, Mordor"):
+            lookup_many(["AT", "Moria", "Mordor"], AGSICountry)
+
+    @pytest.mark.asyncio
+    async def test_agsi_graph(self):
+        graph = agsi_graph()
+        assert graph is agsi_graph()
+        assert AGSIFacility.ugs_rehden in graph.facilities("DE")
+        assert graph.facilities("DE", "astora") == (
+            AGSIFacility.ugs_jemgum_h_astora,
+            AGSIFacility.ugs_rehden,
+            AGSIFacility.vsp_nord_rehden_jemgum,
+        )
+        assert graph.company_of("ugs_rehden") is AGSICompany.astora
+        assert AGSICountry.DE in graph.countries()
+        with pytest.raises(ValueError):
+            graph.facilities("Moria")
+
+    @pytest.mark.asyncio
+    async def test_raw_client_with_invalid_max_concurrency(self):
+        with pytest.raises(ValueError):
+            GieRawClient(api_key=API_KEY, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_raw_client_with_invalid_window_days(self):
+        with pytest.raises(ValueError):
+            GieRawClient(api_key=API_KEY, window_days=0)
+
+    @pytest.mark.asyncio
+    async def test_raw_client_with_invalid_requests_per_second(self):
+        with pytest.raises(ValueError):
+            GieRawClient(api_key=API_KEY, requests_per_second=0)
+
+    @pytest.mark.asyncio
+    async def test_retry_policy_with_invalid_max_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @pytest.mark.asyncio
+    async def test_retry_policy_backoff_is_capped(self):
+        retry_policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+        assert [retry_policy.backoff(attempt) for attempt in range(1, 6)] == [
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_raw_client_retries_a_bad_gateway(self, stub_transport):
+        transport = stub_transport((502, {}), (503, {}), {"data": []})
+        collector = MetricsCollector()
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED",
+            transport=transport,
+            retry_policy=RetryPolicy(backoff_base=0.05, jitter=False),
+            metrics_hook=collector,
+        )
+
+        assert await raw_client.query_country_agsi_storage("AT") == {
+            "data": []
+        }
+        (metrics,) = collector.records
+        assert (metrics.attempts, metrics.retries) == (3, 2)
+        times = [started for started, _, _ in transport.requests]
+        assert times[1] - times[0] >= 0.04
+        assert times[2] - times[1] >= 0.09
+
+        transport.responses = [(404, {})]
+        with pytest.raises(ClientResponseError):
+            await raw_client.query_country_agsi_storage("DE")
+        assert len(transport.requests) == 4
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_retry_after_pauses_the_client(
+        self, stub_transport
+    ):
+        transport = stub_transport((429, {"Retry-After": "0.2"}), {"data": []})
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport
+        )
+
+        limited = asyncio.ensure_future(
+            raw_client.query_country_agsi_storage("AT")
+        )
+        await asyncio.sleep(0.05)
+        other = await raw_client.query_country_agsi_storage("DE")
+        assert await limited == other == {"data": []}
+
+        (limited_at, _, _), (first_at, _, first), (second_at, _, second) = (
+            transport.requests
+        )
+        assert first_at - limited_at >= 0.19
+        assert second_at - limited_at >= 0.19
+        assert {first["country"], second["country"]} == {"AT", "DE"}
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_clients_sharing_a_connector(self):
+        connector = create_connector(limit=10)
+        first_client = GieRawClient(api_key=API_KEY, connector=connector)
+        second_client = GieRawClient(api_key=API_KEY, connector=connector)
+
+        await first_client.close_session()
+        assert not connector.closed
+        await second_client.query_agsi_news_listing()
+
+        await second_client.close_session()
+        await connector.close()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_with_file_cache(self, tmp_path):
+        cache = FileCache(str(tmp_path))
+        raw_client = GieRawClient(api_key=API_KEY, cache=cache)
+
+        result = await raw_client.query_country_agsi_storage(
+            "AT", start="2020-01-01", end="2020-01-31"
+        )
+        assert len(list(tmp_path.iterdir())) == 1
+        assert result == await raw_client.query_country_agsi_storage(
+            "AT", start="2020-01-01", end="2020-01-31"
+        )
+
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_coalesces_identical_requests(self):
+        raw_client = GieRawClient(api_key=API_KEY, memory_cache=MemoryCache())
+
+        results = await asyncio.gather(
+            *(
+                raw_client.query_country_agsi_storage("DE", date="2022-01-01")
+                for _ in range(10)
+            )
+        )
+        assert all(result is results[0] for result in results)
+
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_cancelled_caller_does_not_cancel_the_others(
+        self, stub_transport
+    ):
+        transport = stub_transport({"data": []}, delay=0.05)
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport
+        )
+
+        first = asyncio.ensure_future(
+            raw_client.query_country_agsi_storage("AT")
+        )
+        second = asyncio.ensure_future(
+            raw_client.query_country_agsi_storage("AT")
+        )
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == {"data": []}
+        assert first.cancelled()
+        assert len(transport.requests) == 1
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_request_without_callers_is_cancelled(
+        self, stub_transport
+    ):
+        transport = stub_transport({"data": []}, delay=0.05)
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport
+        )
+
+        caller = asyncio.ensure_future(
+            raw_client.query_country_agsi_storage("AT")
+        )
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0)
+
+        assert not raw_client._in_flight
+        assert await raw_client.query_country_agsi_storage("AT") == {
+            "data": []
+        }
+        assert len(transport.requests) == 2
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_evicts_least_recently_used(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("first", 1, None)
+        cache.set("second", 2, None)
+        cache.get("first")
+        cache.set("third", 3, None)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_cache_expiry(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("fresh", {"data": []}, None)
+        cache.set("expired", {"data": []}, -1)
+
+        assert cache.get("fresh") == {"data": []}
+        assert cache.get("expired") is None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_policy_ttl(self):
+        cache_policy = CachePolicy(recent_ttl=60)
+
+        assert (
+            cache_policy.ttl("https://agsi.gie.eu/api/", {"to": "2020-01-01"})
+            is None
+        )
+        assert cache_policy.ttl("https://agsi.gie.eu/api/", {}) == 60
+        assert cache_policy.ttl("https://agsi.gie.eu/api/news", {}) == 600
+
+    @pytest.mark.asyncio
+    async def test_raw_client_with_custom_json_loads(self):
+        decoded = []
+
+        def json_loads(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        raw_client = GieRawClient(api_key=API_KEY, json_loads=json_loads)
+        await raw_client.query_agsi_news_listing()
+        assert len(decoded) == 1 and isinstance(decoded[0], bytes)
+
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_records_and_replays_a_cassette(self, tmp_path):
+        path = str(tmp_path / "cassette.json.gz")
+        recording_client = GieRawClient(
+            api_key=API_KEY, transport=CassetteTransport(path, "record")
+        )
+        recorded = await recording_client.query_country_agsi_storage(
+            "AT", start="2022-01-01", end="2022-03-31", all_pages=True
+        )
+        await recording_client.close_session()
+
+        replaying_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        assert recorded == await replaying_client.query_country_agsi_storage(
+            "AT", start="2022-01-01", end="2022-03-31", all_pages=True
+        )
+        await replaying_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_replays_a_cassette_offline(self, make_cassette):
+        path = make_cassette(
+            (APIType.AGSI.value, {"country": "AT"}, {"data": []})
+        )
+
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=CassetteTransport(path)
+        )
+        assert await raw_client.query_country_agsi_storage("AT") == {
+            "data": []
+        }
+        with pytest.raises(CassetteMissError):
+            await raw_client.query_country_agsi_storage("DE")
+        await raw_client.close_session()
+
+    @pytest.mark.asyncio
+    async def test_raw_client_metrics_hook_offline(self, make_cassette):
+        path = make_cassette(
+            (APIType.AGSI.value, {"country": "AT"}, {"data": []})
+        )
+
+        collector = MetricsCollector()
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED",
+            transport=CassetteTransport(path),
+            memory_cache=MemoryCache(),
+            metrics_hook=collector,
+        )
+        await raw_client.query_country_agsi_storage("AT")
+        await raw_client.query_country_agsi_storage("AT")
+        with pytest.raises(CassetteMissError):
+            await raw_client.query_country_agsi_storage("DE")
+        await raw_client.close_session()
+
+        first, second, missing = collector.records
+        assert (first.cache, first.attempts, first.response_bytes) == (
+            None,
+            1,
+            12,
+        )
+        assert second.cache == "memory"
+        assert isinstance(missing.error, CassetteMissError)
+        assert collector.summary()[""]["requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_raw_client_metrics_hook(self):
+        collector = MetricsCollector()
+        raw_client = GieRawClient(api_key=API_KEY, metrics_hook=collector)
+
+        await raw_client.query_agsi_news_listing()
+        await raw_client.close_session()
+
+        (metrics,) = collector.records
+        assert metrics.endpoint == "news"
+        assert metrics.status == 200
+        assert metrics.ttfb is not None and metrics.elapsed >= metrics.ttfb
+
+    @pytest.mark.asyncio
+    async def test_raw_client_rate_limiter_burst(self):
+        raw_client = GieRawClient(
+            api_key=API_KEY, requests_per_second=1, burst=3
+        )
+        for _ in range(3):
+            await asyncio.wait_for(raw_client.rate_limiter.acquire(), 0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(raw_client.rate_limiter.acquire(), 0.1)
+        await raw_client.close_session()
+
     @pytest.mark.asyncio
     async def test_gie_raw_client_session_request_with_correct_url(
         self, client
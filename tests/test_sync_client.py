@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from decouple import config
+
+from roiti.gie.cache import SQLiteCache, cache_key
+from roiti.gie.gie_pandas_client import GiePandasClient
+from roiti.gie.gie_sync_client import GieSyncClient
+from roiti.gie.mappings.api_mappings import APIType
+from roiti.gie.transport import CassetteTransport
+
+API_KEY = config("API_KEY")
+
+
+class TestGieSyncClient:
+    @pytest.fixture(scope="class")
+    def client(self):
+        sync_client = GieSyncClient(api_key=API_KEY)
+
+        yield sync_client
+
+        sync_client.close()
+
+    def test_query_country_agsi_storage_with_incorrect_country(self, client):
+        with pytest.raises(ValueError):
+            client.query_country_agsi_storage("Moria")
+
+    def test_query_country_agsi_storage_from_several_threads(self, client):
+        results = []
+
+        def query():
+            results.append(
+                client.query_country_agsi_storage("AT", date="2022-01-01")
+            )
+
+        threads = [threading.Thread(target=query) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 4
+        assert all(result == results[0] for result in results)
+
+    def test_iter_agsi_facility_storage(self, client):
+        records = []
+        for page in client.iter_agsi_facility_storage(
+            "ugs_berlin", start="2021-01-01", end="2021-12-31"
+        ):
+            records.extend(page)
+        assert len(records) == 365
+
+    def test_closed_sync_client(self):
+        sync_client = GieSyncClient(api_key=API_KEY)
+        sync_client.close()
+        sync_client.close()
+
+        with pytest.raises(RuntimeError):
+            sync_client.query_agsi_news_listing()
+
+    def test_sync_client_methods_are_blocking_offline(self, make_cassette):
+        path = make_cassette(
+            (
+                APIType.AGSI.value,
+                {"country": "AT"},
+                {"data": [{"code": "AT", "full": "50.1"}]},
+            )
+        )
+        sync_client = GieSyncClient(
+            api_key="NO_NETWORK_NEEDED",
+            client_class=GiePandasClient,
+            transport=CassetteTransport(path),
+        )
+
+        assert "close_session" in dir(GieSyncClient)
+        assert GieSyncClient.fetch.__doc__ == GiePandasClient.fetch.__doc__
+        with sync_client.profile() as profile:
+            result = sync_client.query_country_agsi_storage("AT")
+        assert result["full"].tolist() == [50.1]
+        assert profile.requests == 1
+        assert profile.stages["float_conversion"]["calls"] == 1
+
+        assert sync_client.close_session() is None
+        sync_client.close()
+
+    def test_sync_client_with_sqlite_cache_offline(
+        self, tmp_path, stub_transport
+    ):
+        transport = stub_transport({"data": [{"code": "AT", "full": "50.1"}]})
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        sync_client = GieSyncClient(
+            api_key="NO_NETWORK_NEEDED", cache=cache, transport=transport
+        )
+
+        first = sync_client.query_country_agsi_storage("AT")
+        second = sync_client.query_country_agsi_storage("AT")
+        sync_client.close()
+
+        assert first == second == {"data": [{"code": "AT", "full": "50.1"}]}
+        assert len(transport.requests) == 1
+        _, url, params = transport.requests[0]
+        assert cache.get(cache_key(url, params)) == first
+        cache.close()
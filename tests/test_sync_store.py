@@ -0,0 +1,108 @@
+import asyncio
+import datetime
+
+import pytest
+import pytest_asyncio
+from decouple import config
+
+from roiti.gie.gie_raw_client import GieRawClient
+from roiti.gie.gie_sync_store import GieSyncStore
+from roiti.gie.mappings.agsi_country import AGSICountry
+from roiti.gie.mappings.agsi_facility import AGSIFacility
+
+API_KEY = config("API_KEY")
+
+
+class TestGieSyncStore:
+    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(scope="class")
+    async def client(self):
+        raw_client = GieRawClient(api_key=API_KEY)
+
+        yield raw_client
+
+        await raw_client.close_session()
+
+    @pytest_asyncio.fixture(scope="class")
+    def event_loop(self):
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+        yield loop
+        loop.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_store_with_invalid_entity(self, client, tmp_path):
+        with pytest.raises(ValueError):
+            GieSyncStore(str(tmp_path / "store.db"), client, ["DE"])
+
+    @pytest.mark.asyncio
+    async def test_sync_store_only_fetches_the_missing_tail(
+        self, client, tmp_path
+    ):
+        store = GieSyncStore(
+            str(tmp_path / "store.db"),
+            client,
+            [AGSICountry.AT, AGSIFacility.ugs_berlin],
+            initial_start="2022-01-01",
+        )
+
+        written = await store.sync()
+        assert written["AGSICountry.AT"] > 0
+        last_gas_day = store.last_gas_day(AGSICountry.AT)
+
+        await store.sync()
+        assert store.last_gas_day(AGSICountry.AT) >= last_gas_day
+
+        result = store.load([AGSICountry.AT])
+        gas_days = [record["gasDayStart"] for record in result["data"]]
+        assert gas_days == sorted(set(gas_days), reverse=True)
+        assert gas_days[-1] == "2022-01-01"
+
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_store_second_sync_fetches_the_tail_offline(
+        self, stub_transport, tmp_path
+    ):
+        today = datetime.date.today()
+        published = today - datetime.timedelta(days=2)
+
+        def storage(url, params):
+            day = datetime.date.fromisoformat(params["from"])
+            last_day = min(
+                datetime.date.fromisoformat(params["to"]), published
+            )
+            records = []
+            while day <= last_day:
+                records.append({"gasDayStart": day.isoformat(), "code": "AT"})
+                day += datetime.timedelta(days=1)
+            return {"last_page": 1, "data": records[::-1]}
+
+        transport = stub_transport(storage)
+        raw_client = GieRawClient(
+            api_key="NO_NETWORK_NEEDED", transport=transport
+        )
+        store = GieSyncStore(
+            str(tmp_path / "store.db"),
+            raw_client,
+            [AGSICountry.AT],
+            initial_start=today - datetime.timedelta(days=10),
+        )
+
+        assert await store.sync() == {"AGSICountry.AT": 9}
+        assert len(transport.requests) == 1
+
+        published = today
+        assert await store.sync() == {"AGSICountry.AT": 2}
+        assert len(transport.requests) == 2
+        _, _, params = transport.requests[-1]
+        assert (
+            params["from"] == (today - datetime.timedelta(days=1)).isoformat()
+        )
+        assert params["to"] == today.isoformat()
+        assert store.last_gas_day(AGSICountry.AT) == today
+
+        assert await store.sync() == {"AGSICountry.AT": 0}
+        assert len(transport.requests) == 2
+
+        store.close()
+        await raw_client.close_session()